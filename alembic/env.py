@@ -6,7 +6,7 @@ from alembic import context
 
 from job_agent.models.base import DATABASE_URL, Base
 # Import all models so Base.metadata is populated
-from job_agent.models import User, UserProfile, UserSettings, SeenJob, RunHistory  # noqa: F401
+from job_agent.models import User, UserProfile, UserSettings, SeenJob, RunHistory, AIScore, UserStats  # noqa: F401
 
 config = context.config
 
@@ -19,11 +19,21 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def _include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Leave out model indexes limited to another dialect (Index.ddl_if), so
+    autogenerate/check don't ask to create them here."""
+    ddl_if = getattr(obj, "_ddl_if", None) if type_ == "index" and not reflected else None
+    if ddl_if is not None and ddl_if.dialect is not None:
+        return ddl_if.dialect == context.get_context().dialect.name
+    return True
+
+
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=_include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -38,7 +48,7 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(connection=connection, target_metadata=target_metadata, include_object=_include_object)
         with context.begin_transaction():
             context.run_migrations()
 
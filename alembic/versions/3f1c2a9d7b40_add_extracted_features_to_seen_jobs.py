@@ -0,0 +1,32 @@
+"""add extracted keyword features to seen_jobs_v2
+
+Revision ID: 3f1c2a9d7b40
+Revises: 66b8a4385583
+Create Date: 2026-10-15 10:12:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7b40'
+down_revision: Union[str, Sequence[str], None] = '66b8a4385583'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('seen_jobs_v2', sa.Column('extracted_skills', sa.JSON(), nullable=False, server_default='[]'))
+    op.add_column('seen_jobs_v2', sa.Column('extracted_keywords', sa.JSON(), nullable=False, server_default='[]'))
+    op.add_column('seen_jobs_v2', sa.Column('extracted_years', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('seen_jobs_v2', 'extracted_years')
+    op.drop_column('seen_jobs_v2', 'extracted_keywords')
+    op.drop_column('seen_jobs_v2', 'extracted_skills')
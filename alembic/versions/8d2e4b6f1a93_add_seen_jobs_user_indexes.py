@@ -0,0 +1,30 @@
+"""add (user_id, match_score) and (user_id, first_seen_at) indexes to seen_jobs_v2
+
+Revision ID: 8d2e4b6f1a93
+Revises: 3f1c2a9d7b40
+Create Date: 2026-10-15 11:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e4b6f1a93'
+down_revision: Union[str, Sequence[str], None] = '3f1c2a9d7b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_seen_user_score', 'seen_jobs_v2', ['user_id', 'match_score'], unique=False, postgresql_include=['id'])
+    op.create_index('ix_seen_user_first_seen', 'seen_jobs_v2', ['user_id', 'first_seen_at'], unique=False, postgresql_include=['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_seen_user_first_seen', table_name='seen_jobs_v2')
+    op.drop_index('ix_seen_user_score', table_name='seen_jobs_v2')
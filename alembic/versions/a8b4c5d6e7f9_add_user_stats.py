@@ -0,0 +1,46 @@
+"""add user_stats counters
+
+Revision ID: a8b4c5d6e7f9
+Revises: f7a3b4c5d6e8
+Create Date: 2026-10-15 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8b4c5d6e7f9'
+down_revision: Union[str, Sequence[str], None] = 'f7a3b4c5d6e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('total_jobs', sa.Integer(), nullable=False),
+    sa.Column('jobs_emailed', sa.Integer(), nullable=False),
+    sa.Column('total_runs', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    # Backfill from the existing rows; pipeline runs keep them current
+    op.execute(
+        "INSERT INTO user_stats (user_id, total_jobs, jobs_emailed, total_runs, updated_at) "
+        "SELECT u.id, "
+        "(SELECT COUNT(*) FROM seen_jobs_v2 s WHERE s.user_id = u.id), "
+        "(SELECT COUNT(s.sent_at) FROM seen_jobs_v2 s WHERE s.user_id = u.id), "
+        "(SELECT COUNT(*) FROM run_history_v2 r WHERE r.user_id = u.id), "
+        "CURRENT_TIMESTAMP "
+        "FROM users u"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_stats')
@@ -0,0 +1,49 @@
+"""store seen_jobs_v2.job_id as 32 raw bytes instead of 64 hex chars
+
+Revision ID: b7a1c5e3d208
+Revises: 8d2e4b6f1a93
+Create Date: 2026-10-15 11:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7a1c5e3d208'
+down_revision: Union[str, Sequence[str], None] = '8d2e4b6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _convert_rows(convert) -> None:
+    """Rewrite every job_id in place (SQLite has no hex/bytea cast)."""
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, job_id FROM seen_jobs_v2")).fetchall()
+    if rows:
+        conn.execute(
+            sa.text("UPDATE seen_jobs_v2 SET job_id = :job_id WHERE id = :id"),
+            [{"id": row.id, "job_id": convert(row.job_id)} for row in rows],
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("ALTER TABLE seen_jobs_v2 ALTER COLUMN job_id TYPE BYTEA USING decode(job_id, 'hex')")
+        return
+    _convert_rows(bytes.fromhex)
+    with op.batch_alter_table('seen_jobs_v2') as batch_op:
+        batch_op.alter_column('job_id', existing_type=sa.String(length=64), type_=sa.LargeBinary(length=32))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("ALTER TABLE seen_jobs_v2 ALTER COLUMN job_id TYPE VARCHAR(64) USING encode(job_id, 'hex')")
+        return
+    _convert_rows(lambda value: bytes(value).hex())
+    with op.batch_alter_table('seen_jobs_v2') as batch_op:
+        batch_op.alter_column('job_id', existing_type=sa.LargeBinary(length=32), type_=sa.String(length=64))
@@ -0,0 +1,32 @@
+"""drop the skills index outside Postgres
+
+Revision ID: b9c5d6e7f8a1
+Revises: a8b4c5d6e7f9
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9c5d6e7f8a1'
+down_revision: Union[str, Sequence[str], None] = 'a8b4c5d6e7f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # c4d9e2f7a1b6 used to create ix_user_profiles_skills on every backend;
+    # outside Postgres it was a plain index over the JSON text that no query uses
+    if op.get_bind().dialect.name != 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_user_profiles_skills')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Nothing to restore: the index is Postgres-only
+    pass
@@ -0,0 +1,46 @@
+"""include id in the dashboard sort indexes on Postgres
+
+Revision ID: c1d6e7f8a9b2
+Revises: b9c5d6e7f8a1
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1d6e7f8a9b2'
+down_revision: Union[str, Sequence[str], None] = 'b9c5d6e7f8a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns); 8d2e4b6f1a93 and f7a3b4c5d6e8 built these
+# without INCLUDE (id) on databases migrated before they were changed
+_INDEXES = (
+    ('ix_seen_user_score', 'seen_jobs_v2', ['user_id', 'match_score']),
+    ('ix_seen_user_first_seen', 'seen_jobs_v2', ['user_id', 'first_seen_at']),
+    ('ix_seen_user_source_score', 'seen_jobs_v2', ['user_id', 'source', 'match_score']),
+    ('ix_run_history_user_run_at', 'run_history_v2', ['user_id', 'run_at']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite indexes already carry the rowid (= id); nothing to do there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for name, table, columns in _INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, columns, unique=False, postgresql_include=['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for name, table, columns in _INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, columns, unique=False)
@@ -0,0 +1,38 @@
+"""use JSONB for user_profiles list columns and GIN-index skills
+
+Revision ID: c4d9e2f7a1b6
+Revises: b7a1c5e3d208
+Create Date: 2026-10-15 12:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d9e2f7a1b6'
+down_revision: Union[str, Sequence[str], None] = 'b7a1c5e3d208'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_LIST_COLUMNS = ('skills', 'job_titles', 'education', 'keywords')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The GIN index only exists on Postgres; elsewhere it would be a plain
+    # index over the JSON text that no query uses
+    if op.get_bind().dialect.name == 'postgresql':
+        for column in _LIST_COLUMNS:
+            op.execute(f"ALTER TABLE user_profiles ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb")
+        op.create_index('ix_user_profiles_skills', 'user_profiles', ['skills'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_user_profiles_skills', table_name='user_profiles', postgresql_using='gin')
+        for column in _LIST_COLUMNS:
+            op.execute(f"ALTER TABLE user_profiles ALTER COLUMN {column} TYPE JSON USING {column}::json")
@@ -0,0 +1,39 @@
+"""add ai_scores_v2 cache table
+
+Revision ID: d5e8f1a2b3c4
+Revises: c4d9e2f7a1b6
+Create Date: 2026-10-15 13:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e8f1a2b3c4'
+down_revision: Union[str, Sequence[str], None] = 'c4d9e2f7a1b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ai_scores_v2',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('profile_hash', sa.String(length=64), nullable=False),
+    sa.Column('job_id', sa.LargeBinary(length=32), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('reason', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'profile_hash', 'job_id', name='uq_user_profile_job')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ai_scores_v2')
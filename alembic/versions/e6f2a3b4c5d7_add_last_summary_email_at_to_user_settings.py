@@ -0,0 +1,28 @@
+"""add last_summary_email_at to user_settings
+
+Revision ID: e6f2a3b4c5d7
+Revises: d5e8f1a2b3c4
+Create Date: 2026-10-15 22:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f2a3b4c5d7'
+down_revision: Union[str, Sequence[str], None] = 'd5e8f1a2b3c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user_settings', sa.Column('last_summary_email_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user_settings', 'last_summary_email_at')
@@ -0,0 +1,33 @@
+"""add dashboard sort indexes
+
+Revision ID: f7a3b4c5d6e8
+Revises: e6f2a3b4c5d7
+Create Date: 2026-10-15 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a3b4c5d6e8'
+down_revision: Union[str, Sequence[str], None] = 'e6f2a3b4c5d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_seen_user_source_score', 'seen_jobs_v2', ['user_id', 'source', 'match_score'], unique=False, postgresql_include=['id'])
+    op.create_index('ix_run_history_user_run_at', 'run_history_v2', ['user_id', 'run_at'], unique=False, postgresql_include=['id'])
+    # Refresh planner statistics so the new indexes are picked up right away
+    op.execute('ANALYZE seen_jobs_v2')
+    op.execute('ANALYZE run_history_v2')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_run_history_user_run_at', table_name='run_history_v2')
+    op.drop_index('ix_seen_user_source_score', table_name='seen_jobs_v2')
@@ -1,5 +1,6 @@
 """YAML config loading and validation."""
 
+import copy
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -7,6 +8,9 @@ from typing import Optional
 
 import yaml
 
+# LibYAML's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class EmailConfig:
@@ -24,6 +28,7 @@ class SearchConfig:
     remote_ok: bool = True
     experience_years: int = 0
     max_results_per_source: int = 50
+    parallel_fetch: bool = True  # Fetch (title, source) pairs concurrently
 
 
 @dataclass
@@ -31,6 +36,7 @@ class MatchingConfig:
     score_threshold: float = 0.3
     use_ai_matching: bool = False
     ai_pre_filter_threshold: float = 0.2
+    digest_size: int = 0  # Max matched jobs per run/email; 0 = no limit
 
 
 @dataclass
@@ -56,6 +62,25 @@ class AppConfig:
     log_dir: str = "logs"
 
 
+# Parsed YAML keyed by resolved path -> (mtime_ns, size, raw dict)
+_CONFIG_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+
+def _read_config_yaml(path: Path) -> dict:
+    """Parse the config file, reusing the previous parse while the file is unchanged."""
+    stat = path.stat()
+    key = str(path.resolve())
+    cached = _CONFIG_CACHE.get(key)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[2])
+
+    with open(path, "r", encoding="utf-8") as f:
+        raw = yaml.load(f, Loader=_YAML_LOADER) or {}
+
+    _CONFIG_CACHE[key] = (stat.st_mtime_ns, stat.st_size, raw)
+    return copy.deepcopy(raw)
+
+
 def load_config(config_path: str = "config.yaml") -> AppConfig:
     """Load and validate configuration from YAML file."""
     path = Path(config_path)
@@ -65,10 +90,10 @@ def load_config(config_path: str = "config.yaml") -> AppConfig:
             "Copy config.example.yaml to config.yaml and fill in your settings."
         )
 
-    with open(path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+    raw = _read_config_yaml(path)
 
     config = AppConfig()
+    env = os.environ
 
     # Email
     email_raw = raw.get("email", {})
@@ -76,7 +101,7 @@ def load_config(config_path: str = "config.yaml") -> AppConfig:
         smtp_server=email_raw.get("smtp_server", "smtp.gmail.com"),
         smtp_port=email_raw.get("smtp_port", 587),
         sender_email=email_raw.get("sender_email", ""),
-        sender_password=os.environ.get("JOB_AGENT_EMAIL_PASSWORD", email_raw.get("sender_password", "")),
+        sender_password=env.get("JOB_AGENT_EMAIL_PASSWORD", email_raw.get("sender_password", "")),
         recipient_email=email_raw.get("recipient_email", ""),
     )
 
@@ -88,6 +113,7 @@ def load_config(config_path: str = "config.yaml") -> AppConfig:
         remote_ok=search_raw.get("remote_ok", True),
         experience_years=search_raw.get("experience_years", 0),
         max_results_per_source=search_raw.get("max_results_per_source", 50),
+        parallel_fetch=search_raw.get("parallel_fetch", True),
     )
 
     # Matching
@@ -96,13 +122,14 @@ def load_config(config_path: str = "config.yaml") -> AppConfig:
         score_threshold=matching_raw.get("score_threshold", 0.3),
         use_ai_matching=matching_raw.get("use_ai_matching", False),
         ai_pre_filter_threshold=matching_raw.get("ai_pre_filter_threshold", 0.2),
+        digest_size=matching_raw.get("digest_size", 0),
     )
 
     # API keys (env vars take precedence)
     keys_raw = raw.get("api_keys", {})
     config.api_keys = ApiKeys(
-        serpapi_key=os.environ.get("SERPAPI_KEY", keys_raw.get("serpapi_key", "")),
-        openai_api_key=os.environ.get("OPENAI_API_KEY", keys_raw.get("openai_api_key", "")),
+        serpapi_key=env.get("SERPAPI_KEY", keys_raw.get("serpapi_key", "")),
+        openai_api_key=env.get("OPENAI_API_KEY", keys_raw.get("openai_api_key", "")),
     )
 
     # Profile
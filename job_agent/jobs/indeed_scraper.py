@@ -1,18 +1,40 @@
 """Indeed job scraping (secondary source)."""
 
 import logging
-import re
+from io import BytesIO
+from typing import Optional
 from urllib.parse import quote_plus
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from job_agent.jobs.models import JobListing
-from job_agent.utils.http_client import create_session, safe_get
+from job_agent.utils.http_client import declared_charset, fetch_pages, get_session
+from job_agent.utils.text_processing import mentions_remote
 
 logger = logging.getLogger("job_agent.jobs.indeed")
 
 INDEED_BASE = "https://www.indeed.com"
 
+# Compiled XPath queries for job cards and their fields.
+# contains(@class, ...) mirrors the substring class matching used previously.
+_XP_CARDS = etree.XPath(
+    "//div[contains(@class, 'job_seen_beacon') or contains(@class, 'cardOutline')"
+    " or contains(@class, 'resultContent')]"
+)
+_XP_CARDS_FALLBACK = etree.XPath("//a[@data-jk]")
+_XP_TITLE = etree.XPath(".//h2[contains(@class, 'jobTitle')]")
+_XP_TITLE_LINK = etree.XPath(".//a[contains(@class, 'jcs-JobTitle')]")
+_XP_TITLE_SPAN = etree.XPath(".//span[@title]")
+_XP_COMPANY = etree.XPath(".//span[@data-testid='company-name']")
+_XP_COMPANY_FALLBACK = etree.XPath(".//span[contains(@class, 'company')]")
+_XP_LINK = etree.XPath(".//a[@href]")
+_XP_LOCATION = etree.XPath(".//div[@data-testid='text-location']")
+_XP_LOCATION_FALLBACK = etree.XPath(".//div[contains(@class, 'companyLocation')]")
+_XP_SALARY = etree.XPath(
+    ".//div[contains(@class, 'salary') or contains(@class, 'estimated-salary')]"
+)
+_XP_SNIPPET = etree.XPath(".//div[contains(@class, 'job-snippet')]")
+
 
 def fetch_indeed_jobs(
     query: str,
@@ -21,44 +43,55 @@ def fetch_indeed_jobs(
 ) -> list[JobListing]:
     """Scrape job listings from Indeed search results."""
     jobs = []
-    session = create_session()
-    start = 0
+    session = get_session()
 
-    while len(jobs) < max_results:
-        url = (
+    # Page offsets are known up front, so fetch all pages concurrently
+    offsets = range(0, max_results, 10)
+    urls = [
+        (
             f"{INDEED_BASE}/jobs?"
             f"q={quote_plus(query)}"
             f"&l={quote_plus(location)}"
             f"&start={start}"
         )
+        for start in offsets
+    ]
+    responses = fetch_pages(urls, session=session)
 
-        response = safe_get(url, session=session)
+    for start, response in zip(offsets, responses):
         if response is None:
             logger.warning("Failed to fetch Indeed page at start=%d", start)
             break
 
-        new_jobs = _parse_indeed_page(response.text)
+        new_jobs = _parse_indeed_page(response.content, encoding=declared_charset(response))
         if not new_jobs:
             break
 
         jobs.extend(new_jobs)
-        start += 10
+        if len(jobs) >= max_results:
+            break
 
     logger.info("Fetched %d jobs from Indeed for query '%s'", len(jobs), query)
     return jobs[:max_results]
 
 
-def _parse_indeed_page(html: str) -> list[JobListing]:
-    """Parse an Indeed search results page."""
-    soup = BeautifulSoup(html, "lxml")
+def _parse_indeed_page(content: bytes, encoding: Optional[str] = None) -> list[JobListing]:
+    """Parse an Indeed search results page from the raw response body.
+
+    ``encoding`` is the charset from the HTTP headers, if any; otherwise
+    lxml picks it up from the page's <meta charset>.
+    """
+    if not content.strip():
+        return []
+    tree = _parse_html(content, encoding=encoding)
     jobs = []
 
     # Indeed uses job cards with data attributes
-    job_cards = soup.find_all("div", class_=re.compile(r"job_seen_beacon|cardOutline|resultContent"))
+    job_cards = _XP_CARDS(tree)
 
     if not job_cards:
         # Fallback: try finding by data-jk attribute (job key)
-        job_cards = soup.find_all("a", attrs={"data-jk": True})
+        job_cards = _XP_CARDS_FALLBACK(tree)
 
     for card in job_cards:
         job = _parse_indeed_card(card)
@@ -68,31 +101,59 @@ def _parse_indeed_page(html: str) -> list[JobListing]:
     return jobs
 
 
+def _parse_html(content: bytes, encoding: Optional[str] = None) -> etree._Element:
+    """Parse a results page, dropping <script>/<style> bodies as they close.
+
+    Indeed pages carry hundreds of KB of inline JSON and CSS that the card
+    parser never looks at; clearing them during the parse keeps peak memory
+    close to the size of the job cards themselves.
+    """
+    context = etree.iterparse(
+        BytesIO(content), events=("end",), tag=("script", "style"), html=True, encoding=encoding,
+    )
+    for _, elem in context:
+        elem.clear(keep_tail=True)
+    return context.root
+
+
+def _first(xpath: etree.XPath, card) -> Optional[etree._Element]:
+    """Return the first element matched by a compiled XPath, or None."""
+    found = xpath(card)
+    return found[0] if found else None
+
+
+def _text(elem) -> str:
+    """Concatenate an element's stripped text nodes (BeautifulSoup get_text(strip=True))."""
+    return "".join(t.strip() for t in elem.itertext())
+
+
 def _parse_indeed_card(card) -> JobListing | None:
     """Parse a single Indeed job card."""
     # Title
-    title_elem = card.find("h2", class_=re.compile(r"jobTitle")) or card.find("a", class_=re.compile(r"jcs-JobTitle"))
-    if not title_elem:
-        title_elem = card.find("span", attrs={"title": True})
+    title_elem = _first(_XP_TITLE, card)
+    if title_elem is None:
+        title_elem = _first(_XP_TITLE_LINK, card)
+    if title_elem is None:
+        title_elem = _first(_XP_TITLE_SPAN, card)
 
     title = ""
-    if title_elem:
-        title = title_elem.get_text(strip=True)
+    if title_elem is not None:
+        title = _text(title_elem)
 
     if not title:
         return None
 
     # Company
-    company_elem = card.find("span", attrs={"data-testid": "company-name"})
-    if not company_elem:
-        company_elem = card.find("span", class_=re.compile(r"company"))
-    company = company_elem.get_text(strip=True) if company_elem else "Unknown"
+    company_elem = _first(_XP_COMPANY, card)
+    if company_elem is None:
+        company_elem = _first(_XP_COMPANY_FALLBACK, card)
+    company = _text(company_elem) if company_elem is not None else "Unknown"
 
     # URL
-    link_elem = card.find("a", href=True)
+    link_elem = _first(_XP_LINK, card)
     url = ""
-    if link_elem:
-        href = link_elem["href"]
+    if link_elem is not None:
+        href = link_elem.get("href")
         if href.startswith("/"):
             url = f"{INDEED_BASE}{href}"
         elif href.startswith("http"):
@@ -101,21 +162,20 @@ def _parse_indeed_card(card) -> JobListing | None:
             url = f"{INDEED_BASE}/{href}"
 
     # Location
-    location_elem = card.find("div", attrs={"data-testid": "text-location"})
-    if not location_elem:
-        location_elem = card.find("div", class_=re.compile(r"companyLocation"))
-    location = location_elem.get_text(strip=True) if location_elem else ""
+    location_elem = _first(_XP_LOCATION, card)
+    if location_elem is None:
+        location_elem = _first(_XP_LOCATION_FALLBACK, card)
+    location = _text(location_elem) if location_elem is not None else ""
 
     # Salary
-    salary_elem = card.find("div", class_=re.compile(r"salary|estimated-salary"))
-    salary = salary_elem.get_text(strip=True) if salary_elem else ""
+    salary_elem = _first(_XP_SALARY, card)
+    salary = _text(salary_elem) if salary_elem is not None else ""
 
     # Snippet/description
-    snippet_elem = card.find("div", class_=re.compile(r"job-snippet"))
-    description = snippet_elem.get_text(strip=True) if snippet_elem else ""
-
+    snippet_elem = _first(_XP_SNIPPET, card)
+    description = _text(snippet_elem) if snippet_elem is not None else ""
     # Remote detection
-    remote = "remote" in (title + location + description).lower()
+    remote = mentions_remote(title, location, description)
 
     return JobListing(
         title=title,
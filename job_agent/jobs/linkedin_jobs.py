@@ -2,17 +2,48 @@
 
 import logging
 import re
+from html import unescape
+from typing import Optional
 from urllib.parse import quote_plus
 
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from job_agent.jobs.models import JobListing
-from job_agent.utils.http_client import create_session, safe_get
+from job_agent.utils.http_client import fetch_pages, get_session, response_text
+from job_agent.utils.text_processing import mentions_remote
 
 logger = logging.getLogger("job_agent.jobs.linkedin")
 
 LINKEDIN_JOBS_BASE = "https://www.linkedin.com/jobs/search"
 
+# Compiled XPath queries for job cards and their fields.
+# contains(@class, ...) mirrors the substring class matching used previously.
+_XP_CARDS = etree.XPath(
+    "//div[contains(@class, 'base-card') or contains(@class, 'job-search-card')]"
+)
+_XP_CARDS_FALLBACK = etree.XPath("//li[contains(@class, 'jobs-search__result')]")
+_XP_TITLE = etree.XPath(".//h3[contains(@class, 'base-search-card__title')]")
+_XP_TITLE_SR_ONLY = etree.XPath(".//span[contains(@class, 'sr-only')]")
+_XP_COMPANY = etree.XPath(".//h4[contains(@class, 'base-search-card__subtitle')]")
+_XP_COMPANY_LINK = etree.XPath(".//a[contains(@class, 'hidden-nested-link')]")
+_XP_LINK = etree.XPath(".//a[contains(@class, 'base-card__full-link')]")
+_XP_JOB_VIEW_LINK = etree.XPath(".//a[contains(@href, 'linkedin.com/jobs/view')]")
+_XP_LOCATION = etree.XPath(".//span[contains(@class, 'job-search-card__location')]")
+_XP_TIME = etree.XPath(".//time")
+
+# Regex fast path for the standard public card markup (see _scan_linkedin_cards)
+_RE_CARD_BLOCK = re.compile(r"<li\b[^>]*>(.*?)</li>", re.S)
+_RE_CARD_DIV = re.compile(r'<div\b[^>]*\bclass="[^"]*(?:base-card|job-search-card)')
+_RE_CARD_TITLE = re.compile(r'<h3\b[^>]*\bclass="[^"]*base-search-card__title[^"]*"[^>]*>(.*?)</h3>', re.S)
+_RE_CARD_COMPANY = re.compile(r'<h4\b[^>]*\bclass="[^"]*base-search-card__subtitle[^"]*"[^>]*>(.*?)</h4>', re.S)
+_RE_CARD_LINK = re.compile(r'<a\b[^>]*\bclass="[^"]*base-card__full-link[^"]*"[^>]*>')
+_RE_CARD_LOCATION = re.compile(r'<span\b[^>]*\bclass="[^"]*job-search-card__location[^"]*"[^>]*>(.*?)</span>', re.S)
+_RE_CARD_TIME = re.compile(r"<time\b([^>]*)>(.*?)</time>", re.S)
+_RE_HREF = re.compile(r'\bhref="([^"]*)"')
+_RE_DATETIME = re.compile(r'\bdatetime="([^"]*)"')
+_RE_TAG = re.compile(r"<[^>]*>")
+
 
 def fetch_linkedin_jobs(
     query: str,
@@ -25,28 +56,33 @@ def fetch_linkedin_jobs(
     Results may be limited compared to authenticated access.
     """
     jobs = []
-    session = create_session()
-    start = 0
+    session = get_session()
 
-    while len(jobs) < max_results:
-        url = (
+    # Page offsets are known up front, so fetch all pages concurrently
+    offsets = range(0, max_results, 25)  # LinkedIn paginates in groups of 25
+    urls = [
+        (
             f"{LINKEDIN_JOBS_BASE}?"
             f"keywords={quote_plus(query)}"
             f"&location={quote_plus(location)}"
             f"&start={start}"
         )
+        for start in offsets
+    ]
+    responses = fetch_pages(urls, session=session)
 
-        response = safe_get(url, session=session)
+    for start, response in zip(offsets, responses):
         if response is None:
             logger.warning("Failed to fetch LinkedIn Jobs page at start=%d", start)
             break
 
-        new_jobs = _parse_linkedin_jobs_page(response.text)
+        new_jobs = _parse_linkedin_jobs_page(response_text(response))
         if not new_jobs:
             break
 
         jobs.extend(new_jobs)
-        start += 25  # LinkedIn paginates in groups of 25
+        if len(jobs) >= max_results:
+            break
 
     logger.info("Fetched %d jobs from LinkedIn for query '%s'", len(jobs), query)
     return jobs[:max_results]
@@ -54,15 +90,22 @@ def fetch_linkedin_jobs(
 
 def _parse_linkedin_jobs_page(html: str) -> list[JobListing]:
     """Parse a LinkedIn Jobs search results page."""
-    soup = BeautifulSoup(html, "lxml")
+    if not html.strip():
+        return []
+
+    jobs = _scan_linkedin_cards(html)
+    if jobs is not None:
+        return jobs
+
+    tree = lxml_html.fromstring(html)
     jobs = []
 
     # LinkedIn public job cards
-    job_cards = soup.find_all("div", class_=re.compile(r"base-card|job-search-card"))
+    job_cards = _XP_CARDS(tree)
 
     if not job_cards:
         # Fallback selector
-        job_cards = soup.find_all("li", class_=re.compile(r"jobs-search__result"))
+        job_cards = _XP_CARDS_FALLBACK(tree)
 
     for card in job_cards:
         job = _parse_linkedin_job_card(card)
@@ -72,41 +115,103 @@ def _parse_linkedin_jobs_page(html: str) -> list[JobListing]:
     return jobs
 
 
+def _scan_linkedin_cards(html: str) -> list[JobListing] | None:
+    """Extract job cards with regexes, skipping DOM construction.
+
+    Returns None when the page doesn't match the expected public card
+    layout, so the caller can fall back to the full lxml parse.
+    """
+    blocks = [m.group(1) for m in _RE_CARD_BLOCK.finditer(html) if _RE_CARD_DIV.search(m.group(1))]
+    if not blocks or len(blocks) != len(_RE_CARD_DIV.findall(html)):
+        return None
+
+    jobs = []
+    for block in blocks:
+        title_match = _RE_CARD_TITLE.search(block)
+        company_match = _RE_CARD_COMPANY.search(block)
+        link_match = _RE_CARD_LINK.search(block)
+        if not (title_match and company_match and link_match):
+            return None  # Markup drift — let the lxml parser handle it
+
+        title = _fragment_text(title_match.group(1))
+        if not title:
+            return None
+
+        href_match = _RE_HREF.search(link_match.group(0))
+        location_match = _RE_CARD_LOCATION.search(block)
+        location = _fragment_text(location_match.group(1)) if location_match else ""
+
+        posted_date = ""
+        time_match = _RE_CARD_TIME.search(block)
+        if time_match:
+            datetime_match = _RE_DATETIME.search(time_match.group(1))
+            if datetime_match:
+                posted_date = unescape(datetime_match.group(1))
+            posted_date = posted_date or _fragment_text(time_match.group(2))
+
+        jobs.append(JobListing(
+            title=title,
+            company=_fragment_text(company_match.group(1)) or "Unknown",
+            url=unescape(href_match.group(1)) if href_match else "",
+            location=location,
+            source="linkedin",
+            posted_date=posted_date,
+            remote=mentions_remote(title, location),
+        ))
+
+    return jobs
+
+
+def _fragment_text(fragment: str) -> str:
+    """Text of an HTML fragment, equivalent to _text() on the parsed element."""
+    return "".join(unescape(part).strip() for part in _RE_TAG.split(fragment))
+
+
+def _first(xpath: etree.XPath, card) -> Optional[etree._Element]:
+    """Return the first element matched by a compiled XPath, or None."""
+    found = xpath(card)
+    return found[0] if found else None
+
+
+def _text(elem) -> str:
+    """Concatenate an element's stripped text nodes (BeautifulSoup get_text(strip=True))."""
+    return "".join(t.strip() for t in elem.itertext())
+
+
 def _parse_linkedin_job_card(card) -> JobListing | None:
     """Parse a single LinkedIn job card."""
     # Title
-    title_elem = card.find("h3", class_=re.compile(r"base-search-card__title"))
-    if not title_elem:
-        title_elem = card.find("span", class_=re.compile(r"sr-only"))
-    title = title_elem.get_text(strip=True) if title_elem else ""
+    title_elem = _first(_XP_TITLE, card)
+    if title_elem is None:
+        title_elem = _first(_XP_TITLE_SR_ONLY, card)
+    title = _text(title_elem) if title_elem is not None else ""
 
     if not title:
         return None
 
     # Company
-    company_elem = card.find("h4", class_=re.compile(r"base-search-card__subtitle"))
-    if not company_elem:
-        company_elem = card.find("a", class_=re.compile(r"hidden-nested-link"))
-    company = company_elem.get_text(strip=True) if company_elem else "Unknown"
+    company_elem = _first(_XP_COMPANY, card)
+    if company_elem is None:
+        company_elem = _first(_XP_COMPANY_LINK, card)
+    company = _text(company_elem) if company_elem is not None else "Unknown"
 
     # URL
-    link_elem = card.find("a", class_=re.compile(r"base-card__full-link"))
-    if not link_elem:
-        link_elem = card.find("a", href=re.compile(r"linkedin.com/jobs/view"))
-    url = link_elem["href"] if link_elem and link_elem.get("href") else ""
+    link_elem = _first(_XP_LINK, card)
+    if link_elem is None:
+        link_elem = _first(_XP_JOB_VIEW_LINK, card)
+    url = link_elem.get("href", "") if link_elem is not None else ""
 
     # Location
-    location_elem = card.find("span", class_=re.compile(r"job-search-card__location"))
-    location = location_elem.get_text(strip=True) if location_elem else ""
+    location_elem = _first(_XP_LOCATION, card)
+    location = _text(location_elem) if location_elem is not None else ""
 
     # Posted date
-    time_elem = card.find("time")
+    time_elem = _first(_XP_TIME, card)
     posted_date = ""
-    if time_elem:
-        posted_date = time_elem.get("datetime", "") or time_elem.get_text(strip=True)
-
+    if time_elem is not None:
+        posted_date = time_elem.get("datetime", "") or _text(time_elem)
     # Remote detection
-    remote = "remote" in (title + location).lower()
+    remote = mentions_remote(title, location)
 
     return JobListing(
         title=title,
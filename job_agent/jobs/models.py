@@ -3,6 +3,7 @@
 import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
 
@@ -24,12 +25,25 @@ class JobListing:
     match_reason: str = ""
     fetched_at: datetime = field(default_factory=datetime.now)
 
-    @property
+    @cached_property
     def job_id(self) -> str:
-        """Generate a unique ID via SHA-256 of (title, company, url)."""
+        """Generate a unique ID via SHA-256 of (title, company, url).
+
+        SHA-256 is deliberate: IDs are persisted for deduplication, so changing
+        the algorithm would re-surface every previously seen job, and with
+        hardware SHA extensions it is as fast as BLAKE2 on these short keys.
+
+        Computed once per instance; title, company and url are not modified
+        after a listing is parsed.
+        """
         raw = f"{self.title.strip().lower()}|{self.company.strip().lower()}|{self.url.strip().lower()}"
         return hashlib.sha256(raw.encode()).hexdigest()
 
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased "title description", built once for the matchers."""
+        return f"{self.title} {self.description}".lower()
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return {
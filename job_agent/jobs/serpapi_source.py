@@ -3,10 +3,17 @@
 import logging
 from typing import Optional
 
+import requests
+
 from job_agent.jobs.models import JobListing
+from job_agent.utils.http_client import get_session
+from job_agent.utils.text_processing import mentions_remote
 
 logger = logging.getLogger("job_agent.jobs.serpapi")
 
+SERPAPI_SEARCH_URL = "https://serpapi.com/search"
+SERPAPI_TIMEOUT = 60
+
 
 def fetch_serpapi_jobs(
     api_key: str,
@@ -14,17 +21,16 @@ def fetch_serpapi_jobs(
     location: str = "Silicon Valley, California",
     max_results: int = 50,
 ) -> list[JobListing]:
-    """Fetch job listings from Google Jobs via SerpAPI."""
+    """Fetch job listings from Google Jobs via SerpAPI.
+
+    Pages are requested on the shared HTTP session, so every page after the
+    first reuses the open keep-alive connection instead of a new TLS handshake.
+    """
     if not api_key:
         logger.warning("SerpAPI key not configured, skipping Google Jobs source")
         return []
 
-    try:
-        from serpapi import GoogleSearch
-    except ImportError:
-        logger.error("google-search-results package not installed")
-        return []
-
+    session = get_session()
     jobs = []
     start = 0
     chips = None
@@ -36,14 +42,15 @@ def fetch_serpapi_jobs(
             "location": location,
             "api_key": api_key,
             "start": start,
+            "output": "json",
         }
         if chips:
             params["chips"] = chips
 
         try:
-            search = GoogleSearch(params)
-            results = search.get_dict()
-        except Exception as e:
+            response = session.get(SERPAPI_SEARCH_URL, params=params, timeout=SERPAPI_TIMEOUT)
+            results = response.json()
+        except (requests.RequestException, ValueError) as e:
             logger.error("SerpAPI request failed: %s", e)
             break
 
@@ -95,7 +102,7 @@ def _parse_serpapi_job(item: dict) -> Optional[JobListing]:
     location = item.get("location", "")
 
     # Extract description
-    description = item.get("description", "")
+    description = item.get("description") or ""
 
     # Extract salary if available
     salary = ""
@@ -109,7 +116,7 @@ def _parse_serpapi_job(item: dict) -> Optional[JobListing]:
         job_type = salary_info["schedule_type"]
 
     # Remote detection
-    remote = "remote" in (location + title + description).lower()
+    remote = mentions_remote(location, title, description)
 
     # Posted date
     posted_date = salary_info.get("posted_at", "")
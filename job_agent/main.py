@@ -4,8 +4,12 @@ import argparse
 import json
 import logging
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 from job_agent.config import load_config, validate_config, AppConfig
 from job_agent.jobs.models import JobListing
@@ -18,6 +22,18 @@ from job_agent.utils.logging_config import setup_logging
 
 logger = logging.getLogger("job_agent")
 
+# Job sources in priority order (SerpAPI is primary, the scrapers secondary)
+JOB_SOURCES = ("SerpAPI", "Indeed", "LinkedIn Jobs")
+
+# Upper bound on concurrent (title, source) fetches
+FETCH_MAX_WORKERS = 16
+
+# Max in-flight fetches per source host, so multiple titles don't hammer
+# Indeed/LinkedIn at once and trip their anti-bot limits
+PER_SOURCE_CONCURRENCY = 2
+
+_SOURCE_LIMITS = {source: threading.BoundedSemaphore(PER_SOURCE_CONCURRENCY) for source in JOB_SOURCES}
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -57,58 +73,71 @@ def load_profile(config: AppConfig) -> ProfileData:
 
     # Augment profile with search titles so matching works even when
     # the resume titles don't exactly match the configured search terms
-    for title in config.search.job_titles:
-        if title not in profile.job_titles:
-            profile.job_titles.append(title)
+    profile.job_titles = list(dict.fromkeys([*profile.job_titles, *config.search.job_titles]))
 
     return profile
 
 
-def fetch_all_jobs(config: AppConfig) -> list[JobListing]:
-    """Fetch jobs from all configured sources for all search titles."""
-    all_jobs = []
-
-    for title in config.search.job_titles:
-        query = title
-        location = config.search.location
-        max_results = config.search.max_results_per_source
+def _fetch_source(source: str, title: str, config: AppConfig) -> list[JobListing]:
+    """Fetch jobs for one (source, title) pair. Logs and returns [] on failure."""
+    search = config.search
+    try:
+        with _SOURCE_LIMITS[source]:
+            if source == "SerpAPI":
+                from job_agent.jobs.serpapi_source import fetch_serpapi_jobs
+                return fetch_serpapi_jobs(
+                    api_key=config.api_keys.serpapi_key,
+                    query=title,
+                    location=search.location,
+                    max_results=search.max_results_per_source,
+                )
+            if source == "Indeed":
+                from job_agent.jobs.indeed_scraper import fetch_indeed_jobs
+                return fetch_indeed_jobs(
+                    query=title,
+                    location=search.location,
+                    max_results=search.max_results_per_source,
+                )
+            if source == "LinkedIn Jobs":
+                from job_agent.jobs.linkedin_jobs import fetch_linkedin_jobs
+                return fetch_linkedin_jobs(
+                    query=title,
+                    location=search.location,
+                    max_results=search.max_results_per_source,
+                )
+    except Exception as e:
+        logger.error("%s source failed for '%s': %s", source, title, e)
+    return []
+
+
+def iter_fetch_batches(config: AppConfig) -> Iterator[tuple[int, list[JobListing]]]:
+    """Yield (task index, jobs) for each (title, source) fetch as soon as it finishes.
+
+    Pairs are fetched on worker threads since the work is network-bound, so
+    callers can process early batches while later ones are still loading.
+    The index is the pair's position in sequential order (titles, then
+    JOB_SOURCES), for restoring a deterministic order.
+    """
+    tasks = [(source, title) for title in config.search.job_titles for source in JOB_SOURCES]
+
+    if config.search.parallel_fetch and len(tasks) > 1:
+        with ThreadPoolExecutor(max_workers=min(FETCH_MAX_WORKERS, len(tasks))) as pool:
+            futures = {pool.submit(_fetch_source, source, title, config): i for i, (source, title) in enumerate(tasks)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    else:
+        for i, (source, title) in enumerate(tasks):
+            yield i, _fetch_source(source, title, config)
 
-        # SerpAPI (primary)
-        try:
-            from job_agent.jobs.serpapi_source import fetch_serpapi_jobs
-            jobs = fetch_serpapi_jobs(
-                api_key=config.api_keys.serpapi_key,
-                query=query,
-                location=location,
-                max_results=max_results,
-            )
-            all_jobs.extend(jobs)
-        except Exception as e:
-            logger.error("SerpAPI source failed for '%s': %s", title, e)
 
-        # Indeed (secondary)
-        try:
-            from job_agent.jobs.indeed_scraper import fetch_indeed_jobs
-            jobs = fetch_indeed_jobs(
-                query=query,
-                location=location,
-                max_results=max_results,
-            )
-            all_jobs.extend(jobs)
-        except Exception as e:
-            logger.error("Indeed source failed for '%s': %s", title, e)
+def fetch_all_jobs(config: AppConfig) -> list[JobListing]:
+    """Fetch jobs from all configured sources for all search titles.
 
-        # LinkedIn Jobs (secondary)
-        try:
-            from job_agent.jobs.linkedin_jobs import fetch_linkedin_jobs
-            jobs = fetch_linkedin_jobs(
-                query=query,
-                location=location,
-                max_results=max_results,
-            )
-            all_jobs.extend(jobs)
-        except Exception as e:
-            logger.error("LinkedIn Jobs source failed for '%s': %s", title, e)
+    Results are returned in sequential (title, source) order, so the output
+    is the same as a one-at-a-time run.
+    """
+    batches = dict(iter_fetch_batches(config))
+    all_jobs = [job for index in sorted(batches) for job in batches[index]]
 
     logger.info("Total jobs fetched from all sources: %d", len(all_jobs))
     return all_jobs
@@ -168,7 +197,9 @@ def run_pipeline(config: AppConfig, dry_run: bool = False):
 
             # Step 3: Deduplicate against database
             logger.info("Step 3: Deduplicating against database...")
-            new_jobs = db.filter_new_jobs(all_jobs)
+            # One timestamp for every row this run touches
+            now = datetime.now().isoformat()
+            new_jobs = db.filter_new_jobs(all_jobs, now=now)
             logger.info("New jobs after dedup: %d/%d", len(new_jobs), len(all_jobs))
 
             if not new_jobs:
@@ -182,28 +213,39 @@ def run_pipeline(config: AppConfig, dry_run: bool = False):
 
             # Step 4: Score and filter
             logger.info("Step 4: Scoring and filtering jobs...")
-            matched_jobs = score_and_filter_jobs(profile, new_jobs, config)
+            matched_jobs = score_and_filter_jobs(profile, new_jobs, config, ai_cache=db)
             logger.info("Jobs above threshold: %d", len(matched_jobs))
 
-            # Add all new jobs to DB (even unmatched, for dedup tracking)
-            for job in new_jobs:
-                db.add_job(job)
-
             # Deduplicate by (title, company) — same listing may appear
-            # with different URLs from pagination or tracking params
-            seen_pairs = set()
-            unique_matched = []
+            # with different URLs from pagination or tracking params. The
+            # dict keeps the first job per key in digest order (most recent
+            # posting first, score as tiebreaker).
+            unique_matched: dict[tuple[str, str], JobListing] = {}
             for job in matched_jobs:
-                key = (job.title.strip().lower(), job.company.strip().lower())
-                if key not in seen_pairs:
-                    seen_pairs.add(key)
-                    unique_matched.append(job)
+                unique_matched.setdefault((job.title.strip().lower(), job.company.strip().lower()), job)
             if len(unique_matched) < len(matched_jobs):
                 logger.info(
                     "Removed %d duplicate listings, %d unique jobs",
                     len(matched_jobs) - len(unique_matched), len(unique_matched),
                 )
-            matched_jobs = unique_matched
+            matched_jobs = list(unique_matched.values())
+
+            # Step 5: Send email. The digest renders on a worker thread while
+            # the new jobs are written; it is only sent once they're stored,
+            # so a failed write never emails jobs the next run will resend.
+            email_sent = False
+            with ThreadPoolExecutor(max_workers=1) as email_pool:
+                render_future = None
+                if matched_jobs and not dry_run:
+                    render_future = email_pool.submit(render_job_email, matched_jobs)
+
+                # Add all new jobs to DB (even unmatched, for dedup tracking)
+                db.add_jobs(new_jobs, now=now)
+
+                if render_future is not None:
+                    subject, html = render_future.result()
+                    logger.info("Step 5: Sending email with %d matched jobs...", len(matched_jobs))
+                    email_sent = send_email(config.email, subject, html)
 
             if not matched_jobs:
                 logger.info("No jobs above match threshold")
@@ -214,8 +256,6 @@ def run_pipeline(config: AppConfig, dry_run: bool = False):
                 )
                 return
 
-            # Step 5: Send email
-            email_sent = False
             if dry_run:
                 logger.info("DRY RUN - Skipping email. Would send %d jobs:", len(matched_jobs))
                 for i, job in enumerate(matched_jobs[:10], 1):
@@ -223,16 +263,11 @@ def run_pipeline(config: AppConfig, dry_run: bool = False):
                         "  #%d [%.0f%%] %s @ %s",
                         i, job.match_score * 100, job.title, job.company,
                     )
+            elif email_sent:
+                db.mark_jobs_sent([j.job_id for j in matched_jobs], now=now)
+                logger.info("Email sent and jobs marked in database")
             else:
-                logger.info("Step 5: Sending email with %d matched jobs...", len(matched_jobs))
-                subject, html = render_job_email(matched_jobs)
-                email_sent = send_email(config.email, subject, html)
-
-                if email_sent:
-                    db.mark_jobs_sent([j.job_id for j in matched_jobs])
-                    logger.info("Email sent and jobs marked in database")
-                else:
-                    logger.error("Failed to send email - jobs will be retried next run")
+                logger.error("Failed to send email - jobs will be retried next run")
 
             db.record_run(
                 jobs_fetched=jobs_fetched,
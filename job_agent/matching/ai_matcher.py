@@ -1,7 +1,10 @@
 """OpenAI semantic matching (optional, requires API key)."""
 
+import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 from job_agent.jobs.models import JobListing
@@ -9,6 +12,78 @@ from job_agent.profile.models import ProfileData
 
 logger = logging.getLogger("job_agent.matching.ai")
 
+AI_MODEL = "gpt-4o-mini"
+
+# Jobs scored per OpenAI request, and how many requests run at once
+AI_BATCH_SIZE = 15
+AI_MAX_CONCURRENT_BATCHES = 4
+
+
+def profile_hash(profile: ProfileData) -> str:
+    """Stable key for the profile text sent to the model (used to cache AI scores)."""
+    return hashlib.sha256(profile.to_summary_string().encode()).hexdigest()
+
+
+# Fixed prompt text, shared by every request
+_INSTRUCTIONS = "Consider: skills match, experience level, role alignment, and location compatibility."
+_SINGLE_PROMPT_HEAD = (
+    "You are a job matching assistant. Score how well this candidate matches this job posting.\n\n"
+    "CANDIDATE PROFILE:\n"
+)
+_SINGLE_PROMPT_TAIL = (
+    "Respond with ONLY a JSON object (no markdown) containing:\n"
+    '- "score": a float from 0.0 to 1.0 (1.0 = perfect match)\n'
+    '- "reason": a brief explanation (max 100 chars)\n\n'
+    + _INSTRUCTIONS
+)
+_BATCH_PROMPT_HEAD = (
+    "You are a job matching assistant. Score how well this candidate matches each job posting.\n\n"
+    "CANDIDATE PROFILE:\n"
+)
+_BATCH_PROMPT_TAIL = (
+    "Respond with ONLY a JSON array (no markdown) with one object per posting containing:\n"
+    '- "id": the posting number in brackets\n'
+    '- "score": a float from 0.0 to 1.0 (1.0 = perfect match)\n'
+    '- "reason": a brief explanation (max 100 chars)\n\n'
+    + _INSTRUCTIONS
+)
+
+
+@lru_cache(maxsize=32)
+def _create_client(api_key: str):
+    """Return an OpenAI client for the key, reused across calls and runs.
+
+    The client is thread-safe and keeps its HTTP connection pool, so later
+    requests skip the TCP/TLS setup.
+    """
+    try:
+        from openai import OpenAI
+    except ImportError:
+        raise ImportError("openai package required for AI matching. Install with: pip install openai")
+
+    return OpenAI(api_key=api_key)
+
+
+def _job_summary(job: JobListing) -> str:
+    return (
+        f"Title: {job.title}\n"
+        f"Company: {job.company}\n"
+        f"Location: {job.location}\n"
+        f"Description: {job.description[:1500]}"
+    )
+
+
+def _parse_json_content(content: str):
+    """Parse a JSON model response, tolerating a markdown code fence."""
+    content = content.strip()
+    if content.startswith("```"):
+        content = content.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+    return json.loads(content)
+
+
+def _clamp(score) -> float:
+    return round(max(0.0, min(1.0, float(score))), 3)
+
 
 def score_job_with_ai(
     profile: ProfileData,
@@ -20,60 +95,34 @@ def score_job_with_ai(
     Returns (score, reason) where score is 0.0-1.0.
     Raises on API errors so caller can fall back to keyword matching.
     """
-    try:
-        from openai import OpenAI
-    except ImportError:
-        raise ImportError("openai package required for AI matching. Install with: pip install openai")
-
-    client = OpenAI(api_key=api_key)
+    client = _create_client(api_key)
 
     profile_summary = profile.to_summary_string()
 
-    job_summary = (
-        f"Title: {job.title}\n"
-        f"Company: {job.company}\n"
-        f"Location: {job.location}\n"
-        f"Description: {job.description[:1500]}"
-    )
+    job_summary = _job_summary(job)
 
-    prompt = (
-        "You are a job matching assistant. Score how well this candidate matches this job posting.\n\n"
-        f"CANDIDATE PROFILE:\n{profile_summary}\n\n"
-        f"JOB POSTING:\n{job_summary}\n\n"
-        "Respond with ONLY a JSON object (no markdown) containing:\n"
-        '- "score": a float from 0.0 to 1.0 (1.0 = perfect match)\n'
-        '- "reason": a brief explanation (max 100 chars)\n\n'
-        "Consider: skills match, experience level, role alignment, and location compatibility."
-    )
+    prompt = "".join((
+        _SINGLE_PROMPT_HEAD, profile_summary, "\n\nJOB POSTING:\n", job_summary, "\n\n", _SINGLE_PROMPT_TAIL,
+    ))
 
     try:
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=AI_MODEL,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.1,
             max_tokens=150,
         )
 
-        content = response.choices[0].message.content.strip()
-
-        # Parse JSON response
-        # Handle potential markdown code blocks
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1].rsplit("```", 1)[0].strip()
-
-        result = json.loads(content)
-        score = float(result.get("score", 0.0))
+        result = _parse_json_content(response.choices[0].message.content)
+        score = _clamp(result.get("score", 0.0))
         reason = str(result.get("reason", "AI scored"))
 
-        # Clamp score
-        score = max(0.0, min(1.0, score))
-
         logger.debug(
             "AI scored '%s' at %s: %.2f (%s)",
             job.title, job.company, score, reason,
         )
 
-        return round(score, 3), f"[AI] {reason}"
+        return score, f"[AI] {reason}"
 
     except json.JSONDecodeError as e:
         logger.warning("Failed to parse AI response as JSON: %s", e)
@@ -81,3 +130,54 @@ def score_job_with_ai(
     except Exception as e:
         logger.warning("AI matching failed for '%s': %s", job.title, e)
         raise
+
+
+def score_jobs_with_ai(
+    profile: ProfileData,
+    jobs: list[JobListing],
+    api_key: str,
+    batch_size: int = AI_BATCH_SIZE,
+) -> list[Optional[tuple[float, str]]]:
+    """Score many jobs with one OpenAI request per batch of ``batch_size``.
+
+    Returns one entry per job in input order: (score, reason), or None when
+    the job's batch failed or the model left it out, so the caller can fall
+    back to keyword matching for just those jobs. Raises ImportError if the
+    openai package is missing.
+    """
+    if not jobs:
+        return []
+
+    client = _create_client(api_key)
+    batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+
+    # Everything before the postings is identical for every batch
+    prompt_head = "".join((_BATCH_PROMPT_HEAD, profile.to_summary_string(), "\n\nJOB POSTINGS:\n"))
+
+    def _score_batch(batch: list[JobListing]) -> list[Optional[tuple[float, str]]]:
+        postings = "\n\n".join(f"[{i}]\n{_job_summary(job)}" for i, job in enumerate(batch))
+        prompt = "".join((prompt_head, postings, "\n\n", _BATCH_PROMPT_TAIL))
+
+        results: list[Optional[tuple[float, str]]] = [None] * len(batch)
+        try:
+            response = client.chat.completions.create(
+                model=AI_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1,
+                max_tokens=60 * len(batch) + 50,
+            )
+            for item in _parse_json_content(response.choices[0].message.content):
+                idx = int(item.get("id", -1))
+                if 0 <= idx < len(batch):
+                    reason = str(item.get("reason", "AI scored"))
+                    results[idx] = (_clamp(item.get("score", 0.0)), f"[AI] {reason}")
+        except Exception as e:
+            logger.warning("AI batch scoring failed for %d jobs: %s", len(batch), e)
+
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(AI_MAX_CONCURRENT_BATCHES, len(batches))) as pool:
+        scored = [result for batch_results in pool.map(_score_batch, batches) for result in batch_results]
+
+    logger.debug("AI scored %d/%d jobs in %d batches", sum(r is not None for r in scored), len(jobs), len(batches))
+    return scored
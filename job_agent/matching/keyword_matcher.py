@@ -1,6 +1,8 @@
 """Keyword overlap scoring (default, free matcher)."""
 
 import logging
+from dataclasses import dataclass
+from typing import Optional
 
 from job_agent.jobs.models import JobListing
 from job_agent.profile.models import ProfileData
@@ -8,7 +10,8 @@ from job_agent.utils.text_processing import (
     extract_keywords,
     extract_skills,
     extract_years_experience,
-    title_similarity,
+    normalize_title,
+    normalized_title_similarity,
 )
 
 logger = logging.getLogger("job_agent.matching.keyword")
@@ -20,43 +23,120 @@ WEIGHT_KEYWORDS = 0.20
 WEIGHT_EXPERIENCE = 0.10
 
 
-def score_job(profile: ProfileData, job: JobListing) -> tuple[float, str]:
+@dataclass
+class JobFeatures:
+    """Profile-independent terms extracted from a job's text (see extract_job_features)."""
+
+    skills: set[str]
+    keywords: set[str]
+    years: Optional[int] = None
+
+
+def extract_job_features(job: JobListing) -> JobFeatures:
+    """Run the text extractors over a job once, so the result can be stored and reused."""
+    job_text = job.search_text
+    return JobFeatures(
+        skills=extract_skills(job_text, already_lower=True),
+        keywords=set(extract_keywords(job_text, top_n=20, already_lower=True)),
+        years=extract_years_experience(job_text, already_lower=True),
+    )
+
+
+def score_job(
+    profile: ProfileData,
+    job: JobListing,
+    features: Optional[JobFeatures] = None,
+) -> tuple[float, str]:
     """Score a job against a profile using keyword overlap.
 
+    Pass precomputed ``features`` to skip re-running the text extractors.
     Returns (score, reason) where score is 0.0-1.0.
     """
+    return _score_job(profile, set(profile.keywords[:30]), _prepare_titles(profile.job_titles), job, features)
+
+
+def score_jobs(
+    profile: ProfileData,
+    jobs: list[JobListing],
+    features: Optional[list[JobFeatures]] = None,
+) -> list[tuple[float, str]]:
+    """Score many jobs against one profile, in input order.
+
+    Same results as calling score_job per job, but the profile-side term
+    sets and normalized titles are built once for the whole batch.
+    ``features``, if given, holds one JobFeatures per job.
+    """
+    profile_keywords = set(profile.keywords[:30])
+    profile_titles = _prepare_titles(profile.job_titles)
+    if features is None:
+        features = [None] * len(jobs)
+    return [
+        _score_job(profile, profile_keywords, profile_titles, job, job_features)
+        for job, job_features in zip(jobs, features)
+    ]
+
+
+def _prepare_titles(titles: list[str]) -> list[tuple[str, str, set[str]]]:
+    """Pre-normalize titles for _best_title_match: (title, normalized, words)."""
+    prepared = []
+    for title in titles:
+        normalized = normalize_title(title)
+        prepared.append((title, normalized, set(normalized.split())))
+    return prepared
+
+
+def _best_title_match(profile_titles: list[tuple[str, str, set[str]]], job_title: str) -> tuple[float, str]:
+    """Best title_similarity of job_title against the prepared profile titles.
+
+    Normalizes the job title once rather than once per profile title.
+    Returns (score, matching profile title); the first title wins ties.
+    """
+    normalized = normalize_title(job_title)
+    words = set(normalized.split())
+    best_score, best_title = 0.0, ""
+    for title, profile_normalized, profile_words in profile_titles:
+        sim = normalized_title_similarity(profile_normalized, profile_words, normalized, words)
+        if sim > best_score:
+            best_score, best_title = sim, title
+    return best_score, best_title
+
+
+def _score_job(
+    profile: ProfileData,
+    profile_keywords: set[str],
+    profile_titles: list[tuple[str, str, set[str]]],
+    job: JobListing,
+    features: Optional[JobFeatures] = None,
+) -> tuple[float, str]:
     reasons = []
+    job_text = job.search_text
 
-    # 1. Skills overlap (40%)
-    job_text = f"{job.title} {job.description}".lower()
-    job_skills = extract_skills(job_text) | {s for s in profile.skills if s in job_text}
+    # 1. Skills overlap (40%). A profile skill overlaps when it occurs in the
+    # job text; every skill extract_skills() could add to that intersection
+    # is itself a substring of the text, so the extractor isn't needed here.
+    overlap = {s for s in profile.skills if s in job_text}
 
-    if profile.skills and job_skills:
-        overlap = profile.skills & job_skills
+    if overlap:
         skills_score = len(overlap) / max(len(profile.skills), 1)
         skills_score = min(skills_score, 1.0)
-        if overlap:
-            reasons.append(f"Skills: {', '.join(sorted(overlap)[:5])}")
+        reasons.append(f"Skills: {', '.join(sorted(overlap)[:5])}")
     else:
         skills_score = 0.0
 
     # 2. Title similarity (30%)
-    title_score = 0.0
-    best_title_match = ""
-    search_titles = profile.job_titles if profile.job_titles else []
-
-    for profile_title in search_titles:
-        sim = title_similarity(profile_title, job.title)
-        if sim > title_score:
-            title_score = sim
-            best_title_match = profile_title
+    title_score, best_title_match = _best_title_match(profile_titles, job.title)
 
     if title_score > 0.3:
         reasons.append(f"Title match: {best_title_match}")
 
-    # 3. Keyword overlap (20%)
-    job_keywords = set(extract_keywords(job_text, top_n=20))
-    profile_keywords = set(profile.keywords[:30])
+    # 3. Keyword overlap (20%). Without profile keywords the component is 0,
+    # so the job text isn't tokenized at all.
+    if not profile_keywords:
+        job_keywords = set()
+    elif features is not None:
+        job_keywords = features.keywords
+    else:
+        job_keywords = set(extract_keywords(job_text, top_n=20, already_lower=True))
 
     if profile_keywords and job_keywords:
         kw_overlap = profile_keywords & job_keywords
@@ -68,7 +148,10 @@ def score_job(profile: ProfileData, job: JobListing) -> tuple[float, str]:
     # 4. Experience alignment (10%)
     experience_score = 0.0
     if profile.experience_years > 0:
-        job_years = extract_years_experience(job_text)
+        if features is not None:
+            job_years = features.years
+        else:
+            job_years = extract_years_experience(job_text, already_lower=True)
         if job_years is not None:
             diff = abs(profile.experience_years - job_years)
             if diff <= 2:
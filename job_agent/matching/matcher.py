@@ -1,22 +1,59 @@
 """Matcher facade: picks scoring strategy based on config."""
 
+import copy
+import heapq
 import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Optional, Protocol
 
 from job_agent.config import AppConfig
 from job_agent.jobs.models import JobListing
-from job_agent.matching.keyword_matcher import score_job as keyword_score
-from job_agent.matching.ai_matcher import score_job_with_ai
+from job_agent.matching.keyword_matcher import JobFeatures, extract_job_features, score_jobs as keyword_score_jobs
+from job_agent.matching.ai_matcher import profile_hash, score_jobs_with_ai
 from job_agent.profile.models import ProfileData
 
 logger = logging.getLogger("job_agent.matching")
 
+# Upper bound on profiles scored concurrently by score_all_profiles
+MAX_PROFILE_WORKERS = 8
+
+# Keyword scoring without precomputed features tokenizes every job's text;
+# batches at least this large are split across worker processes. With
+# features the scoring is cheaper than pickling the jobs, so it stays serial.
+PROCESS_SCORING_MIN_JOBS = 1000
+SCORE_PROCESS_WORKERS = os.cpu_count() or 1
+
+_score_pool: ProcessPoolExecutor | None = None
+_score_pool_lock = threading.Lock()
+
+
+class AIScoreCache(Protocol):
+    """Storage for AI scores keyed by (profile hash, job_id), e.g. JobDatabase."""
+
+    def get_ai_scores(self, profile_hash: str, job_ids: list[str]) -> dict[str, tuple[float, str]]: ...
+
+    def save_ai_scores(self, profile_hash: str, scores: dict[str, tuple[float, str]]) -> None: ...
+
 
 def score_and_filter_jobs(
     profile: ProfileData,
     jobs: list[JobListing],
     config: AppConfig,
+    ai_cache: Optional[AIScoreCache] = None,
+    features: Optional[list[JobFeatures]] = None,
 ) -> list[JobListing]:
-    """Score all jobs and return those above the threshold, sorted by score descending."""
+    """Score all jobs and return those above the threshold, sorted by score descending.
+
+    When ``ai_cache`` is given, AI scores for an unchanged profile are reused
+    instead of calling OpenAI again for the same job. ``features`` (one per
+    job) skips re-extracting keyword-matching terms. With
+    ``config.matching.digest_size`` set, only that many top matches are kept.
+    """
     use_ai = config.matching.use_ai_matching and config.api_keys.openai_api_key
     threshold = config.matching.score_threshold
     ai_pre_filter = config.matching.ai_pre_filter_threshold
@@ -26,33 +63,53 @@ def score_and_filter_jobs(
     else:
         logger.info("Using keyword matching with threshold %.2f", threshold)
 
-    matched = []
+    # Always compute keyword scores first
+    kw_results = _keyword_scores(profile, jobs, features)
+
+    # AI-score the jobs that pass the keyword pre-filter, in batched requests
+    ai_results: dict[int, tuple[float, str]] = {}
+    if use_ai:
+        candidates = [i for i, (kw_score, _) in enumerate(kw_results) if kw_score >= ai_pre_filter]
+        if ai_cache is not None:
+            p_hash = profile_hash(profile)
+            cached = ai_cache.get_ai_scores(p_hash, [jobs[i].job_id for i in candidates])
+            ai_results = {i: cached[jobs[i].job_id] for i in candidates if jobs[i].job_id in cached}
+            candidates = [i for i in candidates if i not in ai_results]
+            if ai_results:
+                logger.info("Reusing %d cached AI scores", len(ai_results))
+        try:
+            scored = score_jobs_with_ai(
+                profile, [jobs[i] for i in candidates], config.api_keys.openai_api_key
+            )
+            fresh = {i: result for i, result in zip(candidates, scored) if result is not None}
+            ai_results.update(fresh)
+            if ai_cache is not None and fresh:
+                ai_cache.save_ai_scores(p_hash, {jobs[i].job_id: result for i, result in fresh.items()})
+        except Exception as e:
+            # Fall back to keyword scores on any AI error
+            logger.warning("AI matching unavailable, using keyword scores: %s", e)
+
+    # AI scores override keyword scores where present
+    results = [ai_results.get(i, kw) for i, kw in enumerate(kw_results)] if ai_results else kw_results
 
-    for job in jobs:
-        # Always compute keyword score first
-        kw_score, kw_reason = keyword_score(profile, job)
-
-        if use_ai and kw_score >= ai_pre_filter:
-            # Try AI matching for jobs that pass keyword pre-filter
-            try:
-                ai_score, ai_reason = score_job_with_ai(
-                    profile, job, config.api_keys.openai_api_key
-                )
-                job.match_score = ai_score
-                job.match_reason = ai_reason
-            except Exception:
-                # Fall back to keyword score on any AI error
-                job.match_score = kw_score
-                job.match_reason = kw_reason
-        else:
-            job.match_score = kw_score
-            job.match_reason = kw_reason
-
-        if job.match_score >= threshold:
+    matched = []
+    for job, (score, reason) in zip(jobs, results):
+        job.match_score = score
+        job.match_reason = reason
+        if score >= threshold:
             matched.append(job)
 
-    # Sort by posted date (most recent first), then by score as tiebreaker
-    matched.sort(key=lambda j: (j.posted_date or "", j.match_score), reverse=True)
+    # Sort by posted date (most recent first), then by score as tiebreaker.
+    # A digest limit selects the top K with a heap instead of a full sort.
+    # Either way sort_key runs once per job, not once per comparison.
+    def sort_key(job: JobListing) -> tuple[str, float]:
+        return (job.posted_date or "", job.match_score)
+
+    limit = config.matching.digest_size
+    if 0 < limit < len(matched):
+        matched = heapq.nlargest(limit, matched, key=sort_key)
+    else:
+        matched.sort(key=sort_key, reverse=True)
 
     logger.info(
         "Matched %d/%d jobs above threshold %.2f",
@@ -60,3 +117,72 @@ def score_and_filter_jobs(
     )
 
     return matched
+
+
+def _get_score_pool() -> ProcessPoolExecutor:
+    """Return the process-wide keyword scoring pool, creating it on first use.
+
+    Workers are spawned rather than forked, since callers run inside the
+    threaded web app and scheduler.
+    """
+    global _score_pool
+    with _score_pool_lock:
+        if _score_pool is None:
+            _score_pool = ProcessPoolExecutor(
+                max_workers=SCORE_PROCESS_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _score_pool
+
+
+def _discard_score_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken scoring pool so the next large batch builds a fresh one."""
+    global _score_pool
+    with _score_pool_lock:
+        if _score_pool is pool:
+            _score_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _keyword_scores(
+    profile: ProfileData,
+    jobs: list[JobListing],
+    features: Optional[list[JobFeatures]],
+) -> list[tuple[float, str]]:
+    """keyword_score_jobs, split into one chunk per worker process for large batches without features."""
+    if features is not None or SCORE_PROCESS_WORKERS < 2 or len(jobs) < PROCESS_SCORING_MIN_JOBS:
+        return keyword_score_jobs(profile, jobs, features)
+
+    chunk_size = -(-len(jobs) // SCORE_PROCESS_WORKERS)
+    chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+    pool = None
+    try:
+        pool = _get_score_pool()
+        parts = pool.map(keyword_score_jobs, repeat(profile), chunks)
+        return [result for part in parts for result in part]
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning("Process scoring unavailable, scoring serially: %s", e)
+        if pool is not None:
+            _discard_score_pool(pool)
+        return keyword_score_jobs(profile, jobs)
+
+
+def score_all_profiles(
+    profiles: list[ProfileData],
+    jobs: list[JobListing],
+    config: AppConfig,
+) -> list[list[JobListing]]:
+    """Score one job list against several profiles, returning matches per profile.
+
+    Job features are extracted once and shared. Profiles are scored on worker
+    threads, which mostly overlaps the AI requests; each profile gets its own
+    copies of the jobs, since scoring writes match_score/match_reason.
+    """
+    if not profiles:
+        return []
+    features = [extract_job_features(job) for job in jobs]
+
+    def _score(profile: ProfileData) -> list[JobListing]:
+        return score_and_filter_jobs(profile, [copy.copy(job) for job in jobs], config, features=features)
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PROFILE_WORKERS, len(profiles))) as pool:
+        return list(pool.map(_score, profiles))
@@ -1,11 +1,13 @@
 """ORM models for multi-user job agent."""
 
+from .ai_score import AIScore
 from .base import Base, SessionLocal, engine
 from .run_history import RunHistory
 from .seen_job import SeenJob
 from .user import User
 from .user_profile import UserProfile
 from .user_settings import UserSettings
+from .user_stats import UserStats
 
 __all__ = [
     "Base",
@@ -16,4 +18,6 @@ __all__ = [
     "UserSettings",
     "SeenJob",
     "RunHistory",
+    "AIScore",
+    "UserStats",
 ]
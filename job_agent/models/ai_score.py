@@ -0,0 +1,29 @@
+"""AI score model — cached OpenAI match scores per user, profile and job."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .base import Base
+from .seen_job import HexDigest
+
+
+class AIScore(Base):
+    __tablename__ = "ai_scores_v2"
+    __table_args__ = (
+        UniqueConstraint("user_id", "profile_hash", "job_id", name="uq_user_profile_job"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    profile_hash: Mapped[str] = mapped_column(String(64), nullable=False)  # ai_matcher.profile_hash
+    job_id: Mapped[str] = mapped_column(HexDigest, nullable=False)
+
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    reason: Mapped[str] = mapped_column(Text, default="")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+    user: Mapped["User"] = relationship(back_populates="ai_scores")
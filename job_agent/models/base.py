@@ -2,7 +2,12 @@
 
 import os
 
-from sqlalchemy import create_engine
+try:
+    import orjson
+except ImportError:  # optional speedup; SQLAlchemy falls back to the json module
+    orjson = None
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 
@@ -14,14 +19,51 @@ def _get_database_url() -> str:
     return url
 
 
+def _engine_options(url: str) -> dict:
+    """Pool settings per backend (the scheduler and web requests share the engine)."""
+    if url.startswith("sqlite"):
+        # Wait on a locked database instead of failing straight away
+        return {"connect_args": {"timeout": 30}}
+    # Enough connections for every sync-route worker thread (AnyIO's default
+    # limit is 40) plus the scheduler's pipeline runs
+    return {"pool_size": 20, "max_overflow": 30, "pool_recycle": 1800}
+
+
+def _json_options() -> dict:
+    """Use orjson for JSON columns (profile lists, settings) when it's installed."""
+    if orjson is None:
+        return {}
+    return {
+        "json_serializer": lambda value: orjson.dumps(value).decode(),
+        "json_deserializer": orjson.loads,
+    }
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """WAL lets readers run alongside the pipeline's writes; the rest trims I/O."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 DATABASE_URL = _get_database_url()
 
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
     echo=False,
+    # Room for every distinct compiled statement (routes, pipeline, bulk ops)
+    query_cache_size=1200,
+    **_engine_options(DATABASE_URL),
+    **_json_options(),
 )
 
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 
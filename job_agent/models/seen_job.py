@@ -2,21 +2,46 @@
 
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, JSON, LargeBinary, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 from .base import Base
 
 
+class HexDigest(TypeDecorator):
+    """A hex digest (e.g. JobListing.job_id) stored as raw bytes.
+
+    Python code keeps working with the hex string; the column and its
+    indexes hold half as many bytes.
+    """
+
+    impl = LargeBinary(32)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return bytes.fromhex(value) if isinstance(value, str) else value
+
+    def process_result_value(self, value, dialect):
+        return bytes(value).hex() if value is not None else None
+
+
 class SeenJob(Base):
     __tablename__ = "seen_jobs_v2"
     __table_args__ = (
         UniqueConstraint("user_id", "job_id", name="uq_user_job"),
+        # Dashboard listings: a user's jobs by score, by date first seen, and
+        # by source then score (scanned backwards for the DESC orderings).
+        # Postgres INCLUDEs id so page offsets are index-only, as the rowid
+        # already is on SQLite.
+        Index("ix_seen_user_score", "user_id", "match_score", postgresql_include=["id"]),
+        Index("ix_seen_user_first_seen", "user_id", "first_seen_at", postgresql_include=["id"]),
+        Index("ix_seen_user_source_score", "user_id", "source", "match_score", postgresql_include=["id"]),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    job_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)  # SHA-256 hex
+    job_id: Mapped[str] = mapped_column(HexDigest, nullable=False, index=True)  # SHA-256, stored as 32 bytes
 
     title: Mapped[str] = mapped_column(String(500), default="")
     company: Mapped[str] = mapped_column(String(255), default="")
@@ -32,6 +57,11 @@ class SeenJob(Base):
     match_score: Mapped[float] = mapped_column(Float, default=0.0)
     match_reason: Mapped[str] = mapped_column(Text, default="")
 
+    # Keyword-matching terms extracted once at ingestion (see keyword_matcher.JobFeatures)
+    extracted_skills: Mapped[list] = mapped_column(JSON, default=list)
+    extracted_keywords: Mapped[list] = mapped_column(JSON, default=list)
+    extracted_years: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
     first_seen_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
@@ -25,3 +25,5 @@ class User(Base):
     settings: Mapped["UserSettings"] = relationship(back_populates="user", uselist=False, cascade="all, delete-orphan")
     seen_jobs: Mapped[list["SeenJob"]] = relationship(back_populates="user", cascade="all, delete-orphan")
     run_history: Mapped[list["RunHistory"]] = relationship(back_populates="user", cascade="all, delete-orphan")
+    ai_scores: Mapped[list["AIScore"]] = relationship(back_populates="user", cascade="all, delete-orphan")
+    stats: Mapped["UserStats"] = relationship(back_populates="user", uselist=False, cascade="all, delete-orphan")
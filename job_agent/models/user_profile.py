@@ -2,16 +2,24 @@
 
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, JSON, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from job_agent.profile.models import ProfileData
 
 from .base import Base
 
+# Stored as binary JSONB on Postgres (no text re-parse, GIN-indexable), JSON elsewhere
+_JSONList = JSON().with_variant(JSONB(), "postgresql")
+
 
 class UserProfile(Base):
     __tablename__ = "user_profiles"
+    __table_args__ = (
+        # Lets Postgres answer skill-overlap filters (skills ?| array[...]) from the index
+        Index("ix_user_profiles_skills", "skills", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
@@ -24,11 +32,11 @@ class UserProfile(Base):
     phone: Mapped[str] = mapped_column(String(50), default="")
     location: Mapped[str] = mapped_column(String(255), default="")
     summary: Mapped[str] = mapped_column(Text, default="")
-    skills: Mapped[list] = mapped_column(JSON, default=list)
-    job_titles: Mapped[list] = mapped_column(JSON, default=list)
+    skills: Mapped[list] = mapped_column(_JSONList, default=list)
+    job_titles: Mapped[list] = mapped_column(_JSONList, default=list)
     experience_years: Mapped[int] = mapped_column(Integer, default=0)
-    education: Mapped[list] = mapped_column(JSON, default=list)
-    keywords: Mapped[list] = mapped_column(JSON, default=list)
+    education: Mapped[list] = mapped_column(_JSONList, default=list)
+    keywords: Mapped[list] = mapped_column(_JSONList, default=list)
     raw_text: Mapped[str] = mapped_column(Text, default="")
 
     parsed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -51,6 +59,6 @@ class UserProfile(Base):
             job_titles=list(self.job_titles or []),
             experience_years=self.experience_years or 0,
             education=list(self.education or []),
-            keywords=list(self.keywords or []),
+            keywords=list(dict.fromkeys(self.keywords or [])),
             raw_text=self.raw_text or "",
         )
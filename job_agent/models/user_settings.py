@@ -46,6 +46,8 @@ class UserSettings(Base):
     schedule_hour: Mapped[int] = mapped_column(Integer, default=9)
     schedule_minute: Mapped[int] = mapped_column(Integer, default=0)
     schedule_timezone: Mapped[str] = mapped_column(String(50), default="America/New_York")
+    # Last "no new matches" email; runs that fetch nothing send at most one a day
+    last_summary_email_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -0,0 +1,24 @@
+"""User stats model — per-user dashboard counters, refreshed by each pipeline run."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .base import Base
+
+
+class UserStats(Base):
+    __tablename__ = "user_stats"
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_jobs: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    jobs_emailed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_runs: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    user: Mapped["User"] = relationship(back_populates="stats")
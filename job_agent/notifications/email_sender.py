@@ -1,8 +1,9 @@
 """Gmail SMTP email sender."""
 
+import atexit
 import logging
 import smtplib
-from email.mime.multipart import MIMEMultipart
+import threading
 from email.mime.text import MIMEText
 
 from job_agent.config import EmailConfig
@@ -10,6 +11,152 @@ from job_agent.config import EmailConfig
 logger = logging.getLogger("job_agent.notifications")
 
 
+def build_message(sender: str, recipient: str, subject: str, html_body: str) -> MIMEText:
+    """Build a single-part text/html message.
+
+    The old plain-text alternative only said "view this in an HTML client",
+    so it is dropped; ASCII bodies are sent 7bit with no transfer encoding.
+    """
+    msg = MIMEText(html_body, "html")
+    msg["Subject"] = subject
+    msg["From"] = sender
+    msg["To"] = recipient
+    return msg
+
+
+class EmailSenderSession:
+    """One authenticated SMTP connection, reused for every message sent in the block.
+
+    ``ehlo``/``starttls``/``login`` run once on enter, so a batch of messages
+    pays for a single TLS handshake. SMTP errors propagate to the caller::
+
+        with EmailSenderSession(config) as session:
+            for recipient in recipients:
+                session.send(subject, html, recipient)
+    """
+
+    def __init__(self, config: EmailConfig, timeout: float | None = None):
+        self.config = config
+        self.timeout = timeout
+        self._server: smtplib.SMTP | None = None
+
+    def __enter__(self) -> "EmailSenderSession":
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def open(self) -> "EmailSenderSession":
+        """Connect, STARTTLS and log in."""
+        if self.timeout is None:
+            server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
+        else:
+            server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port, timeout=self.timeout)
+        try:
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+            server.login(self.config.sender_email, self.config.sender_password)
+        except BaseException:
+            server.close()
+            raise
+        self._server = server
+        return self
+
+    def close(self) -> None:
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except smtplib.SMTPException:
+            pass
+        finally:
+            server.close()
+
+    def is_alive(self) -> bool:
+        """True if the connection is open and answers NOOP."""
+        if self._server is None:
+            return False
+        try:
+            return self._server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def send(self, subject: str, html_body: str, to: str | None = None) -> None:
+        """Send one message; ``to`` defaults to the configured recipient."""
+        if self._server is None:
+            raise RuntimeError("EmailSenderSession used outside its with-block")
+        recipient = to or self.config.recipient_email
+        msg = build_message(self.config.sender_email, recipient, subject, html_body)
+        # send_message serializes straight to bytes, without an as_string() copy
+        self._server.send_message(msg)
+
+
+# Long-lived SMTP sessions keyed by (server, port, login); see send_with_shared_session.
+# The password stays on the session's config, so a changed password replaces
+# the session instead of leaving the old one open under a stale key.
+# The global lock only guards the dicts; each key's lock serializes the
+# connect/login/send on that session, so a slow server holds up only its own users.
+_shared_sessions: dict[tuple, EmailSenderSession] = {}
+_session_locks: dict[tuple, threading.Lock] = {}
+_shared_sessions_lock = threading.Lock()
+
+
+def _session_lock(key: tuple) -> threading.Lock:
+    with _shared_sessions_lock:
+        lock = _session_locks.get(key)
+        if lock is None:
+            lock = _session_locks[key] = threading.Lock()
+        return lock
+
+
+def send_with_shared_session(
+    config: EmailConfig,
+    subject: str,
+    html_body: str,
+    timeout: float | None = None,
+) -> None:
+    """Send via a process-wide SMTP session for these credentials. Raises on failure.
+
+    Scheduled runs reuse the authenticated connection instead of paying for
+    TCP, TLS and login every time; a dropped connection (failed NOOP) is
+    reopened once, and a changed password logs in again. Sessions are closed
+    at interpreter exit.
+    """
+    key = (config.smtp_server, config.smtp_port, config.sender_email)
+    with _session_lock(key):
+        session = _shared_sessions.get(key)
+        if (
+            session is None
+            or session.config.sender_password != config.sender_password
+            or not session.is_alive()
+        ):
+            if session is not None:
+                session.close()
+            session = EmailSenderSession(config, timeout=timeout).open()
+            with _shared_sessions_lock:
+                _shared_sessions[key] = session
+        try:
+            session.send(subject, html_body, config.recipient_email)
+        except smtplib.SMTPServerDisconnected:
+            session.close()
+            session = EmailSenderSession(config, timeout=timeout).open()
+            with _shared_sessions_lock:
+                _shared_sessions[key] = session
+            session.send(subject, html_body, config.recipient_email)
+
+
+@atexit.register
+def _close_shared_sessions() -> None:
+    with _shared_sessions_lock:
+        sessions = list(_shared_sessions.items())
+        _shared_sessions.clear()
+    for key, session in sessions:
+        with _session_lock(key):
+            session.close()
+
+
 def send_email(
     config: EmailConfig,
     subject: str,
@@ -27,23 +174,9 @@ def send_email(
         logger.error("No recipient email configured")
         return False
 
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = config.sender_email
-    msg["To"] = config.recipient_email
-
-    # Plain text fallback
-    plain_text = f"View this email in an HTML-capable client.\n\nSubject: {subject}"
-    msg.attach(MIMEText(plain_text, "plain"))
-    msg.attach(MIMEText(html_body, "html"))
-
     try:
-        with smtplib.SMTP(config.smtp_server, config.smtp_port) as server:
-            server.ehlo()
-            server.starttls()
-            server.ehlo()
-            server.login(config.sender_email, config.sender_password)
-            server.sendmail(config.sender_email, config.recipient_email, msg.as_string())
+        with EmailSenderSession(config) as session:
+            session.send(subject, html_body)
 
         logger.info("Email sent successfully to %s", config.recipient_email)
         return True
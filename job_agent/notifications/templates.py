@@ -6,89 +6,78 @@ from urllib.parse import quote_plus, urlsplit, urlunsplit
 
 from job_agent.jobs.models import JobListing
 
-
-def render_job_email(jobs: list[JobListing], dry_run: bool = False) -> tuple[str, str]:
-    """Render an HTML email with matched job listings.
-
-    Returns (subject, html_body).
-    """
-    date_str = datetime.now().strftime("%B %d, %Y")
-    prefix = "[DRY RUN] " if dry_run else ""
-    subject = f"{prefix}Job Agent: {len(jobs)} new matching jobs - {date_str}"
-
-    job_rows = "\n".join(_render_job_row(job, i + 1) for i, job in enumerate(jobs))
-
-    html = f"""<!DOCTYPE html>
+# Static page head (styles and header) and footer of the digest email
+_EMAIL_HEAD = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background-color: #f5f5f5;
             margin: 0;
             padding: 20px;
             color: #333;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 700px;
             margin: 0 auto;
             background: #fff;
             border-radius: 8px;
             overflow: hidden;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .header {{
+        }
+        .header {
             background: #1a73e8;
             color: white;
             padding: 24px;
             text-align: center;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 22px;
             font-weight: 600;
-        }}
-        .header p {{
+        }
+        .header p {
             margin: 8px 0 0;
             opacity: 0.9;
             font-size: 14px;
-        }}
-        .content {{
+        }
+        .content {
             padding: 24px;
-        }}
-        .job-card {{
+        }
+        .job-card {
             border: 1px solid #e0e0e0;
             border-radius: 8px;
             padding: 16px;
             margin-bottom: 16px;
             transition: border-color 0.2s;
-        }}
-        .job-card:hover {{
+        }
+        .job-card:hover {
             border-color: #1a73e8;
-        }}
-        .job-header {{
+        }
+        .job-header {
             display: flex;
             justify-content: space-between;
             align-items: flex-start;
             margin-bottom: 8px;
-        }}
-        .job-title {{
+        }
+        .job-title {
             font-size: 16px;
             font-weight: 600;
             color: #1a73e8;
             text-decoration: none;
             margin: 0;
-        }}
-        .job-title a {{
+        }
+        .job-title a {
             color: #1a73e8;
             text-decoration: none;
-        }}
-        .job-title a:hover {{
+        }
+        .job-title a:hover {
             text-decoration: underline;
-        }}
-        .score-badge {{
+        }
+        .score-badge {
             background: #e8f5e9;
             color: #2e7d32;
             padding: 4px 10px;
@@ -96,59 +85,57 @@ def render_job_email(jobs: list[JobListing], dry_run: bool = False) -> tuple[str
             font-size: 12px;
             font-weight: 600;
             white-space: nowrap;
-        }}
-        .score-high {{
+        }
+        .score-high {
             background: #e8f5e9;
             color: #2e7d32;
-        }}
-        .score-medium {{
+        }
+        .score-medium {
             background: #fff3e0;
             color: #ef6c00;
-        }}
-        .score-low {{
+        }
+        .score-low {
             background: #fce4ec;
             color: #c62828;
-        }}
-        .job-company {{
+        }
+        .job-company {
             font-size: 14px;
             color: #555;
             margin: 4px 0;
-        }}
-        .job-meta {{
+        }
+        .job-meta {
             font-size: 13px;
             color: #777;
             margin: 4px 0;
-        }}
-        .job-reason {{
+        }
+        .job-reason {
             font-size: 13px;
             color: #666;
             margin-top: 8px;
             font-style: italic;
-        }}
-        .footer {{
+        }
+        .footer {
             background: #fafafa;
             padding: 16px 24px;
             text-align: center;
             font-size: 12px;
             color: #999;
             border-top: 1px solid #eee;
-        }}
-        .rank {{
+        }
+        .rank {
             color: #999;
             font-size: 13px;
             margin-right: 8px;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>Daily Job Matches</h1>
-            <p>{len(jobs)} new job{'' if len(jobs) == 1 else 's'} found - {date_str}</p>
-        </div>
-        <div class="content">
-            {job_rows}
-        </div>
+"""
+
+_EMAIL_TAIL = """        </div>
         <div class="footer">
             Sent by Job Agent | Automated daily job matching
         </div>
@@ -156,6 +143,34 @@ def render_job_email(jobs: list[JobListing], dry_run: bool = False) -> tuple[str
 </body>
 </html>"""
 
+
+def render_job_email(jobs: list[JobListing], dry_run: bool = False) -> tuple[str, str]:
+    """Render an HTML email with matched job listings.
+
+    Returns (subject, html_body).
+    """
+    date_str = datetime.now().strftime("%B %d, %Y")
+    prefix = "[DRY RUN] " if dry_run else ""
+    count = len(jobs)
+    subject = f"{prefix}Job Agent: {count} new matching jobs - {date_str}"
+
+    # Collect every fragment in one list and join once, so the job cards
+    # aren't copied into an intermediate string first
+    parts = [
+        _EMAIL_HEAD,
+        f"            <p>{count} new job{'' if count == 1 else 's'} found - {date_str}</p>\n"
+        "        </div>\n"
+        '        <div class="content">\n'
+        "            ",
+    ]
+    for rank, job in enumerate(jobs, 1):
+        if rank > 1:
+            parts.append("\n")
+        parts.append(_render_job_row(job, rank))
+    parts.append("\n")
+    parts.append(_EMAIL_TAIL)
+    html = "".join(parts)
+
     return subject, html
 
 
@@ -1,21 +1,38 @@
 """Pipeline adapter — converts DB config into AppConfig and runs the existing pipeline."""
 
 import logging
-import smtplib
+import threading
 import time
-from datetime import datetime, timezone
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from job_agent.config import AppConfig, EmailConfig, SearchConfig, MatchingConfig, ApiKeys, ProfileConfig
 from job_agent.jobs.models import JobListing
-from job_agent.main import fetch_all_jobs
+from job_agent.main import iter_fetch_batches
+from job_agent.matching.keyword_matcher import JobFeatures, extract_job_features
 from job_agent.matching.matcher import score_and_filter_jobs
-from job_agent.models import SessionLocal, SeenJob, RunHistory, UserProfile, UserSettings
+from job_agent.models import AIScore, SessionLocal, SeenJob, RunHistory, UserProfile, UserSettings, UserStats
+from job_agent.notifications.email_sender import send_with_shared_session
 from job_agent.notifications.templates import render_job_email
 
 logger = logging.getLogger("job_agent.pipeline")
 
+_resend_lock = threading.Lock()
+
+# Description prefix stored with each seen job (the email and AI prompt use less)
+SEEN_DESCRIPTION_CHARS = 2000
+
+# Per-user AppConfig, reused while the settings row's updated_at is unchanged
+_config_cache: dict[int, tuple[datetime, AppConfig]] = {}
+_config_cache_lock = threading.Lock()
+
+# Runs that fetch no jobs send the "no new matches" confirmation at most this often
+SUMMARY_EMAIL_INTERVAL = timedelta(hours=24)
+
 
 def _send_email_with_detail(
     config: EmailConfig, subject: str, html_body: str, resend_api_key: str = ""
@@ -23,36 +40,28 @@ def _send_email_with_detail(
     """Send email via Resend (HTTP) if key provided, otherwise SMTP. Raises on failure."""
     if resend_api_key:
         import resend
-        resend.api_key = resend_api_key
-        resend.Emails.send({
-            "from": f"Job Agent <{config.sender_email}>",
-            "to": [config.recipient_email],
-            "subject": subject,
-            "html": html_body,
-        })
+        # resend.api_key is module-global: hold the lock so concurrent runs
+        # for different users can't send with each other's key
+        with _resend_lock:
+            if resend.api_key != resend_api_key:
+                resend.api_key = resend_api_key
+            resend.Emails.send({
+                "from": f"Job Agent <{config.sender_email}>",
+                "to": [config.recipient_email],
+                "subject": subject,
+                "html": html_body,
+            })
         return True
 
-    # Fallback to SMTP (won't work on Railway / most cloud hosts)
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = config.sender_email
-    msg["To"] = config.recipient_email
-    msg.attach(MIMEText(f"View this email in an HTML-capable client.\n\nSubject: {subject}", "plain"))
-    msg.attach(MIMEText(html_body, "html"))
-
-    with smtplib.SMTP(config.smtp_server, config.smtp_port, timeout=30) as server:
-        server.ehlo()
-        server.starttls()
-        server.ehlo()
-        server.login(config.sender_email, config.sender_password)
-        server.sendmail(config.sender_email, config.recipient_email, msg.as_string())
+    # Fallback to SMTP (won't work on Railway / most cloud hosts). The
+    # connection is kept open for this sender's next scheduled run.
+    send_with_shared_session(config, subject, html_body, timeout=30)
 
     return True
 
 
-def _no_matches_email(jobs_fetched: int, new_jobs: int) -> str:
-    """Render a simple HTML email for runs with no new matches."""
-    return f"""\
+# Static body of the no-matches email; {jobs_fetched} and {new_jobs} are filled per run
+_NO_MATCHES_TEMPLATE = """\
 <html><body style="font-family: sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
 <h2 style="color: #333;">Job Agent — No New Matches</h2>
 <p>Your scheduled pipeline ran successfully but found no new matches this time.</p>
@@ -65,6 +74,26 @@ def _no_matches_email(jobs_fetched: int, new_jobs: int) -> str:
 </body></html>"""
 
 
+@lru_cache(maxsize=64)
+def _no_matches_email(jobs_fetched: int, new_jobs: int) -> str:
+    """Render a simple HTML email for runs with no new matches.
+
+    Cached: the body depends only on the two counts, which repeat across
+    scheduled runs.
+    """
+    return _NO_MATCHES_TEMPLATE.format_map({"jobs_fetched": jobs_fetched, "new_jobs": new_jobs})
+
+
+def _summary_sent_recently(settings: UserSettings, now: datetime) -> bool:
+    """Whether a "no new matches" email went out within SUMMARY_EMAIL_INTERVAL."""
+    last = settings.last_summary_email_at
+    if last is None:
+        return False
+    if last.tzinfo is None:  # SQLite returns naive datetimes
+        last = last.replace(tzinfo=timezone.utc)
+    return now - last < SUMMARY_EMAIL_INTERVAL
+
+
 def build_app_config_for_user(settings: UserSettings, profile: UserProfile) -> AppConfig:
     """Construct an AppConfig dataclass from database rows."""
     return AppConfig(
@@ -95,28 +124,62 @@ def build_app_config_for_user(settings: UserSettings, profile: UserProfile) -> A
     )
 
 
+def _config_for_user(settings: UserSettings, profile: UserProfile) -> AppConfig:
+    """build_app_config_for_user, cached per user until their settings row is updated.
+
+    The cached config is shared between runs, so callers must not modify it.
+    """
+    version = settings.updated_at
+    with _config_cache_lock:
+        cached = _config_cache.get(settings.user_id)
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+
+    config = build_app_config_for_user(settings, profile)
+    if version is not None:
+        with _config_cache_lock:
+            _config_cache[settings.user_id] = (version, config)
+    return config
+
+
 def run_pipeline_for_user(user_id: int) -> None:
     """Full pipeline run for a single user. Safe to call from a thread or scheduler."""
     db = SessionLocal()
     start = time.time()
     try:
-        profile_row = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-        settings = db.query(UserSettings).filter(UserSettings.user_id == user_id).first()
-        if not profile_row or not settings:
+        # Profile and settings in one round-trip
+        row = (
+            db.query(UserProfile, UserSettings)
+            .join(UserSettings, UserSettings.user_id == UserProfile.user_id)
+            .filter(UserProfile.user_id == user_id)
+            .first()
+        )
+        if row is None:
             logger.error("User %d missing profile or settings — skipping", user_id)
             return
+        profile_row, settings = row
 
-        config = build_app_config_for_user(settings, profile_row)
+        config = _config_for_user(settings, profile_row)
         profile_data = profile_row.to_profile_data()
 
         # Augment profile with search titles (mirrors CLI behaviour in main.load_profile)
-        for title in config.search.job_titles:
-            if title not in profile_data.job_titles:
-                profile_data.job_titles.append(title)
+        profile_data.job_titles = list(dict.fromkeys([*profile_data.job_titles, *config.search.job_titles]))
 
-        # Step 1: Fetch jobs
+        # Step 1: Fetch jobs. Each (title, source) batch is checked against
+        # seen_jobs_v2 and has its features extracted as soon as it arrives,
+        # overlapping with the fetches still in flight.
         logger.info("[user:%d] Fetching jobs...", user_id)
-        all_jobs = fetch_all_jobs(config)
+        batches: dict[int, list[JobListing]] = {}
+        seen_ids: set[str] = set()
+        features_by_job: dict[int, JobFeatures] = {}
+        for index, batch in iter_fetch_batches(config):
+            batches[index] = batch
+            batch_seen = _seen_job_ids(db, user_id, list({j.job_id for j in batch}))
+            seen_ids |= batch_seen
+            for job in batch:
+                if job.job_id not in batch_seen:
+                    features_by_job[id(job)] = extract_job_features(job)
+        all_jobs = [job for index in sorted(batches) for job in batches[index]]
         jobs_fetched = len(all_jobs)
 
         new_jobs = []
@@ -126,50 +189,51 @@ def run_pipeline_for_user(user_id: int) -> None:
         if not all_jobs:
             logger.info("[user:%d] No jobs fetched", user_id)
         else:
-            # Step 2: Deduplicate against user's seen_jobs_v2
-            seen_ids = {
-                row.job_id
-                for row in db.query(SeenJob.job_id).filter(SeenJob.user_id == user_id).all()
-            }
+            # Step 2: Deduplicate against user's seen_jobs_v2 (looked up per batch above)
             new_jobs = [j for j in all_jobs if j.job_id not in seen_ids]
             logger.info("[user:%d] New jobs after dedup: %d/%d", user_id, len(new_jobs), jobs_fetched)
 
             if new_jobs:
-                # Step 3: Score and filter
-                matched_jobs = score_and_filter_jobs(profile_data, new_jobs, config)
+                # Step 3: Score and filter. Matching terms were extracted once
+                # per job during the fetch and are stored for later re-scoring.
+                features = [features_by_job[id(job)] for job in new_jobs]
+                matched_jobs = score_and_filter_jobs(
+                    profile_data, new_jobs, config,
+                    ai_cache=_UserAIScoreCache(db, user_id), features=features,
+                )
                 logger.info("[user:%d] Jobs above threshold: %d", user_id, len(matched_jobs))
 
                 # Persist all new jobs (even unmatched, for dedup)
-                for job in new_jobs:
-                    db.add(SeenJob(
-                        user_id=user_id,
-                        job_id=job.job_id,
-                        title=job.title,
-                        company=job.company,
-                        url=job.url,
-                        location=job.location,
-                        description=job.description[:2000] if job.description else "",
-                        salary=job.salary,
-                        source=job.source,
-                        posted_date=job.posted_date,
-                        job_type=job.job_type,
-                        remote=job.remote,
-                        match_score=job.match_score,
-                        match_reason=job.match_reason,
-                        first_seen_at=now,
-                        last_seen_at=now,
-                    ))
-                db.flush()
+                _upsert_seen_jobs(db, [
+                    {
+                        "user_id": user_id,
+                        "job_id": job.job_id,
+                        "title": job.title,
+                        "company": job.company,
+                        "url": job.url,
+                        "location": job.location,
+                        "description": job.description[:SEEN_DESCRIPTION_CHARS],
+                        "salary": job.salary,
+                        "source": job.source,
+                        "posted_date": job.posted_date,
+                        "job_type": job.job_type,
+                        "remote": job.remote,
+                        "match_score": job.match_score,
+                        "match_reason": job.match_reason,
+                        "extracted_skills": sorted(job_features.skills),
+                        "extracted_keywords": sorted(job_features.keywords),
+                        "extracted_years": job_features.years,
+                        "first_seen_at": now,
+                        "last_seen_at": now,
+                    }
+                    for job, job_features in zip(new_jobs, features)
+                ])
 
                 # Deduplicate by (title, company)
-                seen_pairs: set[tuple[str, str]] = set()
-                unique_matched: list[JobListing] = []
+                unique_matched: dict[tuple[str, str], JobListing] = {}
                 for job in matched_jobs:
-                    key = (job.title.strip().lower(), job.company.strip().lower())
-                    if key not in seen_pairs:
-                        seen_pairs.add(key)
-                        unique_matched.append(job)
-                matched_jobs = unique_matched
+                    unique_matched.setdefault((job.title.strip().lower(), job.company.strip().lower()), job)
+                matched_jobs = list(unique_matched.values())
 
         # Step 4: Send email (always — with matches or a summary)
         email_sent = False
@@ -184,6 +248,9 @@ def run_pipeline_for_user(user_id: int) -> None:
         elif not config.email.recipient_email:
             email_error = "Recipient email not configured"
             logger.warning("[user:%d] %s", user_id, email_error)
+        elif not jobs_fetched and _summary_sent_recently(settings, now):
+            # Nothing fetched and the confirmation already went out today
+            logger.info("[user:%d] No jobs fetched — skipping summary email", user_id)
         else:
             if matched_jobs:
                 subject, html = render_job_email(matched_jobs)
@@ -196,12 +263,10 @@ def run_pipeline_for_user(user_id: int) -> None:
                 email_sent = False
                 email_error = f"Email error: {type(smtp_exc).__name__}: {smtp_exc}"
                 logger.error("[user:%d] %s", user_id, email_error)
-            if email_sent:
-                matched_ids = {j.job_id for j in matched_jobs}
-                db.query(SeenJob).filter(
-                    SeenJob.user_id == user_id,
-                    SeenJob.job_id.in_(matched_ids),
-                ).update({SeenJob.sent_at: now}, synchronize_session=False)
+            if email_sent and matched_jobs:
+                _mark_jobs_sent(db, user_id, [j.job_id for j in matched_jobs], now)
+            elif email_sent:
+                settings.last_summary_email_at = now
 
         _record_run(
             db, user_id, start,
@@ -228,6 +293,91 @@ def run_pipeline_for_user(user_id: int) -> None:
         db.close()
 
 
+# Rows per multi-row INSERT / ids per IN list; keeps bind parameters under SQLite's limit
+DB_BATCH_SIZE = 500
+
+
+class _UserAIScoreCache:
+    """matcher.AIScoreCache backed by ai_scores_v2 for one user."""
+
+    def __init__(self, db, user_id: int):
+        self.db = db
+        self.user_id = user_id
+
+    def get_ai_scores(self, profile_hash: str, job_ids: list[str]) -> dict[str, tuple[float, str]]:
+        scores = {}
+        for i in range(0, len(job_ids), DB_BATCH_SIZE):
+            rows = self.db.query(AIScore.job_id, AIScore.score, AIScore.reason).filter(
+                AIScore.user_id == self.user_id,
+                AIScore.profile_hash == profile_hash,
+                AIScore.job_id.in_(job_ids[i:i + DB_BATCH_SIZE]),
+            ).all()
+            scores.update({row.job_id: (row.score, row.reason) for row in rows})
+        return scores
+
+    def save_ai_scores(self, profile_hash: str, scores: dict[str, tuple[float, str]]) -> None:
+        """Upsert and commit right away, so paid-for scores survive a later pipeline failure."""
+        rows = [
+            {"user_id": self.user_id, "profile_hash": profile_hash, "job_id": job_id, "score": score, "reason": reason}
+            for job_id, (score, reason) in scores.items()
+        ]
+        insert = pg_insert if self.db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        for i in range(0, len(rows), DB_BATCH_SIZE):
+            stmt = insert(AIScore).values(rows[i:i + DB_BATCH_SIZE])
+            self.db.execute(stmt.on_conflict_do_update(
+                index_elements=["user_id", "profile_hash", "job_id"],
+                set_={"score": stmt.excluded.score, "reason": stmt.excluded.reason},
+            ))
+        self.db.commit()
+
+
+def _seen_job_ids(db, user_id: int, job_ids: list[str]) -> set[str]:
+    """Return which of job_ids the user has already seen.
+
+    Only the fetched ids are sent to the database, so the cost follows the
+    batch size rather than the user's whole history.
+    """
+    seen = set()
+    for i in range(0, len(job_ids), DB_BATCH_SIZE):
+        rows = db.query(SeenJob.job_id).filter(
+            SeenJob.user_id == user_id,
+            SeenJob.job_id.in_(job_ids[i:i + DB_BATCH_SIZE]),
+        ).all()
+        seen.update(row.job_id for row in rows)
+    return seen
+
+
+def _mark_jobs_sent(db, user_id: int, job_ids: list[str], sent_at: datetime) -> None:
+    """Set sent_at on the user's seen-job rows for job_ids, one UPDATE per batch."""
+    for i in range(0, len(job_ids), DB_BATCH_SIZE):
+        db.execute(
+            update(SeenJob)
+            .where(SeenJob.user_id == user_id, SeenJob.job_id.in_(job_ids[i:i + DB_BATCH_SIZE]))
+            .values(sent_at=sent_at)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _upsert_seen_jobs(db, rows: list[dict]) -> None:
+    """Insert seen-job rows in multi-row statements, refreshing the score on conflict.
+
+    Rows repeating a job_id (the same listing found by two searches) are
+    dropped, since one upsert statement can't touch a row twice.
+    """
+    unique_rows = list({row["job_id"]: row for row in rows}.values())
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    for i in range(0, len(unique_rows), DB_BATCH_SIZE):
+        stmt = insert(SeenJob).values(unique_rows[i:i + DB_BATCH_SIZE])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["user_id", "job_id"],
+            set_={
+                "match_score": stmt.excluded.match_score,
+                "match_reason": stmt.excluded.match_reason,
+                "last_seen_at": stmt.excluded.last_seen_at,
+            },
+        ))
+
+
 def _record_run(
     db,
     user_id: int,
@@ -247,3 +397,26 @@ def _record_run(
         error_message=error_message,
         duration_seconds=round(time.time() - start, 2),
     ))
+    _refresh_user_stats(db, user_id)
+
+
+def _refresh_user_stats(db, user_id: int) -> None:
+    """Recount the user's dashboard counters into user_stats.
+
+    The pipeline is the only writer of seen jobs and runs, so counting once
+    per run (in the run's transaction) keeps the counters exact while page
+    views read a single row.
+    """
+    db.flush()  # SessionLocal doesn't autoflush; count this run's pending rows
+    total_jobs, jobs_emailed = db.query(func.count(SeenJob.id), func.count(SeenJob.sent_at)).filter(
+        SeenJob.user_id == user_id
+    ).one()
+    total_runs = db.query(func.count(RunHistory.id)).filter(RunHistory.user_id == user_id).scalar()
+
+    stats = db.get(UserStats, user_id)
+    if stats is None:
+        stats = UserStats(user_id=user_id)
+        db.add(stats)
+    stats.total_jobs = total_jobs
+    stats.jobs_emailed = jobs_emailed
+    stats.total_runs = total_runs
@@ -2,15 +2,45 @@
 
 import logging
 import re
+from typing import Optional
 
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from job_agent.profile.models import ProfileData
-from job_agent.utils.http_client import safe_get, create_session
-from job_agent.utils.text_processing import extract_keywords, extract_skills
+from job_agent.utils.http_client import create_session, declared_charset, safe_get
+from job_agent.utils.text_processing import extract_skills_and_keywords
 
 logger = logging.getLogger("job_agent.profile.linkedin")
 
+# Bytes of the profile page read from the network; the profile sections
+# come well before this, the rest is scripts and recommendations
+MAX_PROFILE_BYTES = 2_000_000
+# Visible text kept as raw_text and scanned for skills/keywords
+MAX_RAW_TEXT_CHARS = 20_000
+
+# Public profile URL: http(s), any linkedin.com subdomain (www, country
+# codes), then /in/<handle>; case-insensitive
+_PROFILE_URL_RE = re.compile(r"https?://(?:[a-z0-9-]+\.)?linkedin\.com/in/[^/?#\s]+", re.IGNORECASE)
+
+# Compiled XPaths for profile sections; contains(@class, ...) keeps the
+# substring matching on class/id that the page markup needs
+_XP_NAME = etree.XPath("//h1")
+_XP_HEADLINE = etree.XPath("//div[contains(@class, 'headline')]")
+_XP_LOCATION = etree.XPath(
+    "//span[contains(@class, 'location') or contains(@class, 'top-card-layout__first-subline')]"
+)
+_XP_ABOUT = etree.XPath("//section[contains(@class, 'about') or contains(@class, 'summary')]")
+_XP_EXPERIENCE = etree.XPath("//section[contains(@id, 'experience')]")
+_XP_H3 = etree.XPath(".//h3")
+# Visible text nodes: comments are not text() nodes; script/style/template bodies are skipped
+_XP_VISIBLE_TEXT = etree.XPath(".//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+
+
+def is_linkedin_profile_url(url: str) -> bool:
+    """Check that a URL points at a public LinkedIn profile (linkedin.com/in/...)."""
+    return _PROFILE_URL_RE.match(url) is not None
+
 
 def scrape_linkedin_profile(linkedin_url: str) -> ProfileData:
     """Scrape a public LinkedIn profile page.
@@ -19,11 +49,11 @@ def scrape_linkedin_profile(linkedin_url: str) -> ProfileData:
     and may break if LinkedIn changes their HTML structure. For production use,
     consider the LinkedIn API or manual profile entry.
     """
-    if "linkedin.com/in/" not in linkedin_url:
+    if not is_linkedin_profile_url(linkedin_url):
         raise ValueError(f"Invalid LinkedIn profile URL: {linkedin_url}")
 
     session = create_session()
-    response = safe_get(linkedin_url, session=session)
+    response = safe_get(linkedin_url, session=session, stream=True)
 
     if response is None:
         raise ConnectionError(
@@ -31,49 +61,80 @@ def scrape_linkedin_profile(linkedin_url: str) -> ProfileData:
             "LinkedIn may be blocking the request. Consider using a resume file instead."
         )
 
-    soup = BeautifulSoup(response.text, "lxml")
-    return _parse_linkedin_html(soup, linkedin_url)
+    content = _read_limited(response, MAX_PROFILE_BYTES)
+    html = content.decode(declared_charset(response) or "utf-8", errors="replace")
+    return _parse_linkedin_html(_parse_html(html), linkedin_url)
+
+
+def _read_limited(response, limit: int) -> bytes:
+    """Read at most ``limit`` bytes of a streamed response body, then close it."""
+    chunks = []
+    size = 0
+    try:
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= limit:
+                break
+    finally:
+        response.close()
+    return b"".join(chunks)[:limit]
+
+
+def _parse_html(html: str) -> etree._Element:
+    """Parse a profile page into an lxml document (an empty page gives an empty document)."""
+    return lxml_html.document_fromstring(html if html.strip() else "<html></html>")
+
+
+def _first(xpath: etree.XPath, node) -> Optional[etree._Element]:
+    """Return the first element matched by a compiled XPath, or None."""
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def _text(elem) -> str:
+    """Concatenate an element's stripped visible text nodes (BeautifulSoup get_text(strip=True))."""
+    return "".join(t.strip() for t in _XP_VISIBLE_TEXT(elem))
 
 
-def _parse_linkedin_html(soup: BeautifulSoup, url: str) -> ProfileData:
+def _parse_linkedin_html(tree: etree._Element, url: str) -> ProfileData:
     """Parse LinkedIn public profile HTML into ProfileData."""
     profile = ProfileData()
 
     # Extract name
-    name_elem = soup.find("h1")
-    if name_elem:
-        profile.name = name_elem.get_text(strip=True)
+    name_elem = _first(_XP_NAME, tree)
+    if name_elem is not None:
+        profile.name = _text(name_elem)
 
     # Extract headline (usually contains current title)
-    headline_elem = soup.find("div", class_=re.compile(r"headline|top-card-layout__headline"))
-    if headline_elem:
-        headline = headline_elem.get_text(strip=True)
+    headline_elem = _first(_XP_HEADLINE, tree)
+    if headline_elem is not None:
+        headline = _text(headline_elem)
         profile.job_titles = [headline]
         profile.summary = headline
 
     # Extract location
-    location_elem = soup.find("span", class_=re.compile(r"location|top-card-layout__first-subline"))
-    if location_elem:
-        profile.location = location_elem.get_text(strip=True)
+    location_elem = _first(_XP_LOCATION, tree)
+    if location_elem is not None:
+        profile.location = _text(location_elem)
 
     # Extract about section
-    about_section = soup.find("section", class_=re.compile(r"about|summary"))
-    if about_section:
-        about_text = about_section.get_text(strip=True)
+    about_section = _first(_XP_ABOUT, tree)
+    if about_section is not None:
+        about_text = _text(about_section)
         profile.summary = about_text[:1000]
 
-    # Gather all visible text for skill/keyword extraction
-    all_text = soup.get_text(separator=" ", strip=True)
+    # Gather visible text (up to MAX_RAW_TEXT_CHARS) for skill/keyword extraction
+    all_text = " ".join(t for t in (t.strip() for t in _XP_VISIBLE_TEXT(tree)) if t)[:MAX_RAW_TEXT_CHARS]
     profile.raw_text = all_text
-    profile.skills = extract_skills(all_text)
-    profile.keywords = extract_keywords(all_text)
+    profile.skills, profile.keywords = extract_skills_and_keywords(all_text)
 
     # Extract experience entries for titles
-    experience_section = soup.find("section", id=re.compile(r"experience"))
-    if experience_section:
-        title_elems = experience_section.find_all("h3")
+    experience_section = _first(_XP_EXPERIENCE, tree)
+    if experience_section is not None:
+        title_elems = _XP_H3(experience_section)
         for elem in title_elems[:5]:
-            title = elem.get_text(strip=True)
+            title = _text(elem)
             if title and title not in profile.job_titles:
                 profile.job_titles.append(title)
 
@@ -3,9 +3,12 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileData:
-    """Represents a candidate's parsed profile."""
+    """Represents a candidate's parsed profile.
+
+    Slotted: profile fields are read for every job scored.
+    """
 
     name: str = ""
     email: str = ""
@@ -5,10 +5,25 @@ import re
 from pathlib import Path
 
 from job_agent.profile.models import ProfileData
-from job_agent.utils.text_processing import extract_keywords, extract_skills, extract_years_experience
+from job_agent.utils.text_processing import extract_skills_and_keywords, extract_years_experience
 
 logger = logging.getLogger("job_agent.profile")
 
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_PHONE_RE = re.compile(r"(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")
+_NAME_RE = re.compile(r"^[A-Z][a-z]+(?: [A-Z][a-z]+)+$")
+_NAME_EXCLUDE_RE = re.compile(r"[@|•·]")
+_CONTACT_CHARS_RE = re.compile(r"[@|•·\d{3}]")
+# Patterns like "Software Engineer at Company" or "Title | Company"
+_TITLE_RE = re.compile(
+    r"(?:^|\n)\s*([\w\s]+(?:engineer|developer|architect|manager|analyst|designer|scientist|lead|director|consultant))\s*(?:at|@|\||-|–)\s*\w",
+    re.IGNORECASE,
+)
+_SUMMARY_RE = re.compile(
+    r"(?:summary|objective|about|profile)\s*[:|\n]\s*(.+?)(?:\n\s*\n|\n[A-Z]{2,})",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 def parse_resume(file_path: str) -> ProfileData:
     """Parse a resume file (PDF, TXT, or MD) into a ProfileData object."""
@@ -31,19 +46,37 @@ def parse_resume(file_path: str) -> ProfileData:
 
 
 def _extract_pdf_text(path: Path) -> str:
-    """Extract text from a PDF file using PyPDF2."""
+    """Extract text from a PDF file, using pypdfium2 (PDFium) when installed, else PyPDF2."""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        return _extract_pdf_text_pypdf2(path)
+
+    pdf = pdfium.PdfDocument(str(path))
+    try:
+        return "\n".join(text for text in (_pdfium_page_text(page) for page in pdf) if text)
+    finally:
+        pdf.close()
+
+
+def _pdfium_page_text(page) -> str:
+    textpage = page.get_textpage()
+    try:
+        return textpage.get_text_range()
+    finally:
+        textpage.close()
+        page.close()
+
+
+def _extract_pdf_text_pypdf2(path: Path) -> str:
+    """Extract text from a PDF file using the pure-Python PyPDF2 parser."""
     try:
         from PyPDF2 import PdfReader
     except ImportError:
-        raise ImportError("PyPDF2 is required for PDF parsing. Install with: pip install PyPDF2")
+        raise ImportError("pypdfium2 or PyPDF2 is required for PDF parsing. Install with: pip install pypdfium2")
 
     reader = PdfReader(str(path))
-    pages = []
-    for page in reader.pages:
-        text = page.extract_text()
-        if text:
-            pages.append(text)
-    return "\n".join(pages)
+    return "\n".join(text for text in (page.extract_text() for page in reader.pages) if text)
 
 
 def _parse_text_to_profile(text: str) -> ProfileData:
@@ -51,14 +84,12 @@ def _parse_text_to_profile(text: str) -> ProfileData:
     profile = ProfileData(raw_text=text)
 
     # Extract email
-    email_match = re.search(r"[\w.+-]+@[\w-]+\.[\w.-]+", text)
+    email_match = _EMAIL_RE.search(text)
     if email_match:
         profile.email = email_match.group(0)
 
     # Extract phone
-    phone_match = re.search(
-        r"(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", text
-    )
+    phone_match = _PHONE_RE.search(text)
     if phone_match:
         profile.phone = phone_match.group(0)
 
@@ -68,17 +99,14 @@ def _parse_text_to_profile(text: str) -> ProfileData:
         # A name line is typically short, has no special chars, and is mostly title case
         if (
             len(line) < 60
-            and not re.search(r"[@|•·]", line)
-            and re.match(r"^[A-Z][a-z]+(?: [A-Z][a-z]+)+$", line)
+            and not _NAME_EXCLUDE_RE.search(line)
+            and _NAME_RE.match(line)
         ):
             profile.name = line
             break
 
-    # Extract skills
-    profile.skills = extract_skills(text)
-
-    # Extract keywords
-    profile.keywords = extract_keywords(text)
+    # Extract skills and keywords
+    profile.skills, profile.keywords = extract_skills_and_keywords(text)
 
     # Extract years of experience
     years = extract_years_experience(text)
@@ -104,17 +132,10 @@ def _parse_text_to_profile(text: str) -> ProfileData:
 def _extract_job_titles(text: str) -> list[str]:
     """Extract job titles from resume text."""
     titles = []
-    # Look for patterns like "Software Engineer at Company" or "Title | Company"
-    patterns = [
-        r"(?:^|\n)\s*([\w\s]+(?:engineer|developer|architect|manager|analyst|designer|scientist|lead|director|consultant))\s*(?:at|@|\||-|–)\s*\w",
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            title = match.strip()
-            if 3 < len(title) < 60:
-                titles.append(title)
+    for match in _TITLE_RE.findall(text):
+        title = match.strip()
+        if 3 < len(title) < 60:
+            titles.append(title)
 
     # Deduplicate while preserving order
     seen = set()
@@ -131,16 +152,11 @@ def _extract_job_titles(text: str) -> list[str]:
 def _extract_summary(text: str) -> str:
     """Extract a summary/objective section from resume text."""
     # Look for explicit summary/objective section
-    patterns = [
-        r"(?:summary|objective|about|profile)\s*[:|\n]\s*(.+?)(?:\n\s*\n|\n[A-Z]{2,})",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-        if match:
-            summary = match.group(1).strip()
-            if 20 < len(summary) < 1000:
-                return summary
+    match = _SUMMARY_RE.search(text)
+    if match:
+        summary = match.group(1).strip()
+        if 20 < len(summary) < 1000:
+            return summary
 
     # Fallback: first paragraph after contact info (skip first 3 lines)
     lines = text.split("\n")
@@ -148,7 +164,7 @@ def _extract_summary(text: str) -> str:
     started = False
     for line in lines[3:]:
         stripped = line.strip()
-        if stripped and not re.search(r"[@|•·\d{3}]", stripped):
+        if stripped and not _CONTACT_CHARS_RE.search(stripped):
             started = True
             para_lines.append(stripped)
         elif started and not stripped:
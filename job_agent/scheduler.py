@@ -1,16 +1,41 @@
 """APScheduler setup — manages per-user pipeline schedules."""
 
 import logging
+import threading
+import time
 import traceback
+from datetime import datetime
 
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 logger = logging.getLogger("job_agent.scheduler")
 
+# Concurrent pipeline runs; each run fans out its own fetch threads, so
+# this bounds total scraping load when many users share a fire time
+SCHEDULER_MAX_WORKERS = 8
+
+# Applied to every pipeline job: merge a backlog of missed runs into one,
+# never overlap a user's runs, and still fire up to an hour late
+JOB_DEFAULTS = {"coalesce": True, "max_instances": 1, "misfire_grace_time": 3600}
+
 _scheduler: BackgroundScheduler | None = None
 
+# Each scheduled user's trigger, so the schedule page can compute the next
+# fire time without taking the scheduler's job store lock
+_triggers: dict[int, CronTrigger] = {}
+
+# get_scheduler_info snapshot, reused for SCHEDULER_INFO_TTL seconds
+SCHEDULER_INFO_TTL = 1.0
+_info_cache: tuple[float, dict] | None = None
+_info_lock = threading.Lock()
+
+# Users with a "Run Now" pipeline queued or in progress
+_manual_runs: set[int] = set()
+_manual_runs_lock = threading.Lock()
+
 
 def _job_listener(event):
     """Log scheduler job events for debugging."""
@@ -28,7 +53,10 @@ def init_scheduler() -> None:
     global _scheduler
     if _scheduler is not None:
         return
-    _scheduler = BackgroundScheduler()
+    _scheduler = BackgroundScheduler(
+        executors={"default": ThreadPoolExecutor(max_workers=SCHEDULER_MAX_WORKERS)},
+        job_defaults=JOB_DEFAULTS,
+    )
     _scheduler.add_listener(_job_listener, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED)
     _scheduler.start()
     logger.info("APScheduler started")
@@ -39,6 +67,9 @@ def shutdown_scheduler() -> None:
     if _scheduler is not None:
         _scheduler.shutdown(wait=False)
         _scheduler = None
+        _triggers.clear()
+        with _manual_runs_lock:
+            _manual_runs.clear()
         logger.info("APScheduler stopped")
 
 
@@ -58,8 +89,49 @@ def _run_pipeline_wrapper(user_id: int) -> None:
         raise
 
 
-def schedule_user_pipeline(user_id: int, settings) -> None:
-    """Add, update, or remove a user's scheduled pipeline job."""
+def _run_manual_pipeline(user_id: int) -> None:
+    try:
+        _run_pipeline_wrapper(user_id)
+    finally:
+        with _manual_runs_lock:
+            _manual_runs.discard(user_id)
+
+
+def enqueue_user_pipeline(user_id: int) -> bool:
+    """Queue a one-off pipeline run for a user on the scheduler's worker pool.
+
+    Returns False if a manual run for the user is already queued or running.
+    Runs share the pool's SCHEDULER_MAX_WORKERS limit with scheduled ones;
+    failures are recorded in the user's run history by the pipeline.
+    """
+    if _scheduler is None:
+        init_scheduler()
+
+    with _manual_runs_lock:
+        if user_id in _manual_runs:
+            return False
+        _manual_runs.add(user_id)
+
+    try:
+        _scheduler.add_job(
+            _run_manual_pipeline,
+            args=[user_id],
+            id=f"run_now_user_{user_id}",
+            name=f"Manual pipeline run for user {user_id}",
+        )
+    except Exception:
+        with _manual_runs_lock:
+            _manual_runs.discard(user_id)
+        raise
+    logger.info("Queued manual pipeline run for user %d", user_id)
+    return True
+
+
+def schedule_user_pipeline(user_id: int, settings) -> datetime | None:
+    """Add, update, or remove a user's scheduled pipeline job.
+
+    Returns the job's next fire time, or None when scheduling is disabled.
+    """
     global _scheduler
     if _scheduler is None:
         init_scheduler()
@@ -71,9 +143,10 @@ def schedule_user_pipeline(user_id: int, settings) -> None:
     if existing:
         _scheduler.remove_job(job_id)
         logger.info("Removed existing schedule for user %d", user_id)
+    _triggers.pop(user_id, None)
 
     if not settings.schedule_enabled:
-        return
+        return None
 
     # Build cron trigger from user settings
     freq = settings.schedule_frequency or "weekly"
@@ -92,33 +165,44 @@ def schedule_user_pipeline(user_id: int, settings) -> None:
 
     trigger = CronTrigger(**kwargs)
 
-    _scheduler.add_job(
+    job = _scheduler.add_job(
         _run_pipeline_wrapper,
         trigger=trigger,
         args=[user_id],
         id=job_id,
         name=f"Pipeline for user {user_id}",
-        misfire_grace_time=3600,
-        coalesce=True,
         replace_existing=True,
     )
+    _triggers[user_id] = trigger
     logger.info("Scheduled pipeline for user %d: %s at %s", user_id, freq, trigger)
+    return job.next_run_time
 
 
 def get_next_run_time(user_id: int):
-    """Return the next scheduled fire time for a user, or None."""
-    global _scheduler
-    if _scheduler is None:
+    """Return the next scheduled fire time for a user, or None.
+
+    Computed from the user's trigger rather than read from the scheduler,
+    so page views never wait on a job being fired.
+    """
+    trigger = _triggers.get(user_id)
+    if _scheduler is None or trigger is None:
         return None
-    job = _scheduler.get_job(_job_id(user_id))
-    if job:
-        return job.next_run_time
-    return None
+    return trigger.get_next_fire_time(None, datetime.now(trigger.timezone))
 
 
 def get_scheduler_info() -> dict:
-    """Return diagnostic info about the scheduler state."""
-    global _scheduler
+    """Return diagnostic info about the scheduler state (cached for SCHEDULER_INFO_TTL)."""
+    global _info_cache
+    with _info_lock:
+        now = time.monotonic()
+        if _info_cache is not None and now - _info_cache[0] < SCHEDULER_INFO_TTL:
+            return _info_cache[1]
+        info = _scheduler_info()
+        _info_cache = (now, info)
+        return info
+
+
+def _scheduler_info() -> dict:
     if _scheduler is None:
         return {"running": False, "jobs": []}
     jobs = []
@@ -10,6 +10,15 @@ from job_agent.jobs.models import JobListing
 
 logger = logging.getLogger("job_agent.storage")
 
+# Keep IN (...) lists under SQLite's bound-parameter limit
+_MAX_IN_PARAMS = 500
+
+
+def _chunked(values: list, size: int = _MAX_IN_PARAMS):
+    """Yield successive slices of at most ``size`` values."""
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
 
 class JobDatabase:
     """SQLite database for tracking seen jobs and run history."""
@@ -22,9 +31,20 @@ class JobDatabase:
         self._create_tables()
 
     def _connect(self):
-        self.conn = sqlite3.connect(str(self.db_path))
+        # Larger statement cache: every query here is a fixed, parameterized string
+        self.conn = sqlite3.connect(str(self.db_path), cached_statements=256)
         self.conn.row_factory = sqlite3.Row
-        self.conn.execute("PRAGMA journal_mode=WAL")
+        # WAL with NORMAL sync only fsyncs at checkpoints; the larger page
+        # cache and mmap keep the seen_jobs index in memory, and the busy
+        # timeout waits out a concurrent writer instead of failing
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+            PRAGMA busy_timeout=60000;
+        """)
 
     def _create_tables(self):
         self.conn.executescript("""
@@ -51,10 +71,22 @@ class JobDatabase:
                 error_message TEXT DEFAULT NULL
             );
 
+            CREATE TABLE IF NOT EXISTS ai_scores (
+                profile_hash TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                score REAL NOT NULL,
+                reason TEXT NOT NULL,
+                scored_at TEXT NOT NULL,
+                PRIMARY KEY (profile_hash, job_id)
+            );
+
             CREATE INDEX IF NOT EXISTS idx_seen_jobs_sent
                 ON seen_jobs(sent_at);
-            CREATE INDEX IF NOT EXISTS idx_seen_jobs_source
-                ON seen_jobs(source);
+            -- Covers the per-source totals and sent counts in get_stats;
+            -- replaces the narrower source-only index
+            DROP INDEX IF EXISTS idx_seen_jobs_source;
+            CREATE INDEX IF NOT EXISTS idx_seen_jobs_source_sent
+                ON seen_jobs(source, sent_at);
         """)
         self.conn.commit()
 
@@ -65,45 +97,85 @@ class JobDatabase:
         )
         return cursor.fetchone() is not None
 
-    def filter_new_jobs(self, jobs: list[JobListing]) -> list[JobListing]:
+    def seen_job_ids(self, job_ids: list[str]) -> set[str]:
+        """Return the subset of job_ids already present in seen_jobs."""
+        seen = set()
+        for chunk in _chunked(job_ids):
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT job_id FROM seen_jobs WHERE job_id IN ({placeholders})", chunk
+            ).fetchall()
+            seen.update(row["job_id"] for row in rows)
+        return seen
+
+    def filter_new_jobs(self, jobs: list[JobListing], now: str | None = None) -> list[JobListing]:
         """Return only jobs not previously seen. Updates last_seen_at for known jobs."""
-        new_jobs = []
-        now = datetime.now().isoformat()
+        now = now or datetime.now().isoformat()
+
+        # One membership query for the whole batch instead of a SELECT per job
+        seen = self.seen_job_ids([job.job_id for job in jobs])
+        new_jobs = [job for job in jobs if job.job_id not in seen]
 
-        for job in jobs:
-            if self.is_job_seen(job.job_id):
-                self.conn.execute(
+        if seen:
+            with self.conn:
+                self.conn.executemany(
                     "UPDATE seen_jobs SET last_seen_at = ? WHERE job_id = ?",
-                    (now, job.job_id),
+                    [(now, job_id) for job_id in seen],
                 )
-            else:
-                new_jobs.append(job)
-
-        self.conn.commit()
         return new_jobs
 
     def add_job(self, job: JobListing):
         """Insert a new job into the database."""
-        now = datetime.now().isoformat()
-        self.conn.execute(
-            """INSERT OR IGNORE INTO seen_jobs
-               (job_id, title, company, url, location, source, match_score, first_seen_at, last_seen_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                job.job_id, job.title, job.company, job.url,
-                job.location, job.source, job.match_score, now, now,
-            ),
-        )
-        self.conn.commit()
+        self.add_jobs([job])
+
+    def add_jobs(self, jobs: list[JobListing], now: str | None = None):
+        """Insert many new jobs in a single transaction, all stamped with ``now``."""
+        now = now or datetime.now().isoformat()
+        with self.conn:
+            self.conn.executemany(
+                """INSERT OR IGNORE INTO seen_jobs
+                   (job_id, title, company, url, location, source, match_score, first_seen_at, last_seen_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        job.job_id, job.title, job.company, job.url,
+                        job.location, job.source, job.match_score, now, now,
+                    )
+                    for job in jobs
+                ],
+            )
 
-    def mark_jobs_sent(self, job_ids: list[str]):
+    def mark_jobs_sent(self, job_ids: list[str], now: str | None = None):
         """Mark jobs as sent via email."""
-        now = datetime.now().isoformat()
-        for jid in job_ids:
-            self.conn.execute(
+        now = now or datetime.now().isoformat()
+        with self.conn:
+            self.conn.executemany(
                 "UPDATE seen_jobs SET sent_at = ? WHERE job_id = ?",
-                (now, jid),
+                [(now, jid) for jid in job_ids],
             )
+
+    def get_ai_scores(self, profile_hash: str, job_ids: list[str]) -> dict[str, tuple[float, str]]:
+        """Return cached AI (score, reason) pairs for a profile, keyed by job_id."""
+        scores = {}
+        for chunk in _chunked(job_ids):
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT job_id, score, reason FROM ai_scores "
+                f"WHERE profile_hash = ? AND job_id IN ({placeholders})",
+                (profile_hash, *chunk),
+            ).fetchall()
+            scores.update({row["job_id"]: (row["score"], row["reason"]) for row in rows})
+        return scores
+
+    def save_ai_scores(self, profile_hash: str, scores: dict[str, tuple[float, str]]):
+        """Cache AI (score, reason) pairs for a profile, keyed by job_id."""
+        now = datetime.now().isoformat()
+        self.conn.executemany(
+            """INSERT OR REPLACE INTO ai_scores
+               (profile_hash, job_id, score, reason, scored_at)
+               VALUES (?, ?, ?, ?, ?)""",
+            [(profile_hash, job_id, score, reason, now) for job_id, (score, reason) in scores.items()],
+        )
         self.conn.commit()
 
     def record_run(
@@ -134,18 +206,14 @@ class JobDatabase:
         """Get database statistics."""
         stats = {}
 
-        row = self.conn.execute("SELECT COUNT(*) as cnt FROM seen_jobs").fetchone()
-        stats["total_jobs_tracked"] = row["cnt"]
-
-        row = self.conn.execute(
-            "SELECT COUNT(*) as cnt FROM seen_jobs WHERE sent_at IS NOT NULL"
-        ).fetchone()
-        stats["total_jobs_sent"] = row["cnt"]
-
-        row = self.conn.execute(
-            "SELECT COUNT(*) as cnt FROM seen_jobs WHERE sent_at IS NULL"
-        ).fetchone()
-        stats["unsent_jobs"] = row["cnt"]
+        # One index-only scan gives the source breakdown and every job total
+        rows = self.conn.execute(
+            "SELECT source, COUNT(*) as cnt, COUNT(sent_at) as sent FROM seen_jobs GROUP BY source"
+        ).fetchall()
+        stats["by_source"] = {row["source"]: row["cnt"] for row in rows}
+        stats["total_jobs_tracked"] = sum(row["cnt"] for row in rows)
+        stats["total_jobs_sent"] = sum(row["sent"] for row in rows)
+        stats["unsent_jobs"] = stats["total_jobs_tracked"] - stats["total_jobs_sent"]
 
         row = self.conn.execute("SELECT COUNT(*) as cnt FROM run_history").fetchone()
         stats["total_runs"] = row["cnt"]
@@ -163,16 +231,12 @@ class JobDatabase:
                 "error_message": row["error_message"],
             }
 
-        # Source breakdown
-        rows = self.conn.execute(
-            "SELECT source, COUNT(*) as cnt FROM seen_jobs GROUP BY source"
-        ).fetchall()
-        stats["by_source"] = {row["source"]: row["cnt"] for row in rows}
-
         return stats
 
     def close(self):
         if self.conn:
+            # Refresh query planner statistics for tables whose shape changed
+            self.conn.execute("PRAGMA optimize")
             self.conn.close()
             self.conn = None
 
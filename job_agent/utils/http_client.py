@@ -2,8 +2,11 @@
 
 import logging
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -19,8 +22,26 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
 ]
 
+# Shared pool for paginated fetches (see fetch_pages)
+PAGE_POOL_WORKERS = 16
+MAX_REQUESTS_PER_HOST = 4
 
-def create_session(max_retries: int = 3, backoff_factor: float = 1.0) -> requests.Session:
+# Connection pool size for the shared session; covers every page-fetch worker
+SHARED_POOL_MAXSIZE = 32
+
+_shared_session: requests.Session | None = None
+_shared_session_lock = threading.Lock()
+_page_pool: ThreadPoolExecutor | None = None
+_page_pool_lock = threading.Lock()
+_host_limits: dict[str, threading.BoundedSemaphore] = {}
+_host_limits_lock = threading.Lock()
+
+
+def create_session(
+    max_retries: int = 3,
+    backoff_factor: float = 1.0,
+    pool_maxsize: int = 10,
+) -> requests.Session:
     """Create a requests session with retry logic."""
     session = requests.Session()
 
@@ -31,7 +52,7 @@ def create_session(max_retries: int = 3, backoff_factor: float = 1.0) -> request
         allowed_methods=["GET"],
     )
 
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
@@ -44,6 +65,19 @@ def create_session(max_retries: int = 3, backoff_factor: float = 1.0) -> request
     return session
 
 
+def get_session() -> requests.Session:
+    """Return the process-wide scraper session, creating it on first use.
+
+    Sharing one session keeps connections (and TLS handshakes) alive across
+    pages, titles and sources; the pool is sized for the page-fetch pool.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session(pool_maxsize=SHARED_POOL_MAXSIZE)
+        return _shared_session
+
+
 def safe_get(
     url: str,
     session: Optional[requests.Session] = None,
@@ -52,14 +86,81 @@ def safe_get(
 ) -> Optional[requests.Response]:
     """Perform a GET request, returning None on failure instead of raising."""
     if session is None:
-        session = create_session()
+        session = get_session()
 
     try:
-        # Rotate User-Agent per request
-        session.headers["User-Agent"] = random.choice(USER_AGENTS)
-        response = session.get(url, timeout=timeout, **kwargs)
+        # Rotate User-Agent per request (per-request header, so a shared
+        # session isn't mutated from several threads)
+        headers = {"User-Agent": random.choice(USER_AGENTS), **kwargs.pop("headers", {})}
+        response = session.get(url, timeout=timeout, headers=headers, **kwargs)
         response.raise_for_status()
         return response
     except requests.RequestException as e:
         logger.warning("HTTP request failed for %s: %s", url, e)
         return None
+
+
+def _get_page_pool() -> ThreadPoolExecutor:
+    """Return the process-wide pool used for page fetches, creating it on first use."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = ThreadPoolExecutor(max_workers=PAGE_POOL_WORKERS, thread_name_prefix="http")
+        return _page_pool
+
+
+def _host_limit(url: str) -> threading.BoundedSemaphore:
+    host = urlsplit(url).netloc
+    with _host_limits_lock:
+        if host not in _host_limits:
+            _host_limits[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+        return _host_limits[host]
+
+
+def declared_charset(response: requests.Response) -> Optional[str]:
+    """Return the charset from the Content-Type header, or None if none was sent.
+
+    requests reports ISO-8859-1 for any text/* response without a charset;
+    that default is ignored here so the page's own <meta charset> can win.
+    """
+    if "charset" in response.headers.get("Content-Type", "").lower():
+        return response.encoding
+    return None
+
+
+def response_text(response: requests.Response) -> str:
+    """Decode a response body using its declared charset, defaulting to UTF-8.
+
+    Unlike ``response.text`` this never falls back to (slow, pure-Python)
+    charset detection when the server omits the charset.
+    """
+    return response.content.decode(declared_charset(response) or "utf-8", errors="replace")
+
+
+def fetch_pages(
+    urls: list[str],
+    session: Optional[requests.Session] = None,
+    stagger: float = 0.1,
+    **kwargs,
+) -> list[Optional[requests.Response]]:
+    """GET several URLs concurrently, returning responses (or None) in input order.
+
+    Requests run on a shared worker pool with at most ``MAX_REQUESTS_PER_HOST``
+    in flight per host, so concurrent scrapers don't multiply thread count.
+    Request ``i`` is delayed by ``i * stagger`` seconds so a burst of result
+    pages doesn't trip the target site's anti-bot checks.
+    """
+    if not urls:
+        return []
+    if session is None:
+        session = get_session()
+
+    def _get(index: int, url: str) -> Optional[requests.Response]:
+        if index and stagger:
+            time.sleep(index * stagger)
+        with _host_limit(url):
+            return safe_get(url, session=session, **kwargs)
+
+    pool = _get_page_pool()
+    futures = [pool.submit(_get, i, url) for i, url in enumerate(urls)]
+    return [future.result() for future in futures]
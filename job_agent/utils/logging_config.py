@@ -1,13 +1,32 @@
 """Rotating file + console logging setup."""
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+
+# Background thread that writes queued records to the real handlers
+_listener: Optional[QueueListener] = None
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background log writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging(log_dir: str = "logs", level: int = logging.INFO) -> logging.Logger:
-    """Configure application logging with rotating file and console output."""
+    """Configure application logging with rotating file and console output.
+
+    Log calls only enqueue the record; a QueueListener thread does the file
+    and console writes, so hot paths never block on log I/O.
+    """
+    global _listener
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
 
@@ -15,7 +34,9 @@ def setup_logging(log_dir: str = "logs", level: int = logging.INFO) -> logging.L
     logger.setLevel(level)
 
     # Clear existing handlers to avoid duplicates on re-init
+    stop_logging()
     logger.handlers.clear()
+    logger.propagate = False
 
     formatter = logging.Formatter(
         "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -31,13 +52,19 @@ def setup_logging(log_dir: str = "logs", level: int = logging.INFO) -> logging.L
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # Console handler (force UTF-8 to handle emoji in job titles)
     console_stream = open(sys.stdout.fileno(), mode="w", encoding="utf-8", errors="replace", closefd=False)
     console_handler = logging.StreamHandler(console_stream)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
 
     return logger
+
+
+atexit.register(stop_logging)
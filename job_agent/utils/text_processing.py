@@ -2,9 +2,11 @@
 
 import re
 from collections import Counter
+from functools import lru_cache
 
-# Recognized skills for extraction
-SKILLS = {
+# Recognized skills for extraction. Frozen: the matchers below are built
+# from it at import time, so it must not change afterwards.
+SKILLS = frozenset({
     # Languages
     "python", "java", "javascript", "typescript", "c++", "c#", "go", "golang",
     "rust", "ruby", "php", "swift", "kotlin", "scala", "r", "matlab", "perl",
@@ -43,79 +45,128 @@ SKILLS = {
     "labor relations", "compliance", "employment law",
     "hr strategy", "people strategy", "talent strategy",
     "executive search", "headcount planning",
-}
+})
 
-# Common Silicon Valley location indicators
-SILICON_VALLEY_LOCATIONS = {
+# Common Silicon Valley location indicators (frozen, like SKILLS, because
+# _SILICON_VALLEY_RE is built from it)
+SILICON_VALLEY_LOCATIONS = frozenset({
     "silicon valley", "san francisco", "san jose", "palo alto", "mountain view",
     "sunnyvale", "cupertino", "menlo park", "santa clara", "redwood city",
     "fremont", "oakland", "berkeley", "south bay", "bay area", "sf bay",
     "sf", "san mateo", "foster city",
-}
+})
+_SILICON_VALLEY_RE = re.compile(
+    "|".join(re.escape(loc) for loc in sorted(SILICON_VALLEY_LOCATIONS, key=len, reverse=True))
+)
+
+_REMOTE_RE = re.compile("remote", re.IGNORECASE)
+
+
+# Skills of <= 2 chars need word boundaries to avoid false positives; they
+# share one alternation so the text is scanned once for all of them. Longer
+# skills are plain substring checks: ``in`` runs in C and beats a regex union
+# over ~140 alternatives, and it keeps overlapping matches ("java" inside
+# "javascript") that a single regex scan would consume.
+_SHORT_SKILLS_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(skill) for skill in sorted(SKILLS) if len(skill) <= 2) + r")\b"
+)
+_LONG_SKILLS = tuple(skill for skill in SKILLS if len(skill) > 2)
+
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will", "would",
+    "could", "should", "may", "might", "can", "shall", "this", "that",
+    "these", "those", "i", "you", "he", "she", "it", "we", "they", "me",
+    "him", "her", "us", "them", "my", "your", "his", "its", "our", "their",
+    "not", "no", "nor", "so", "if", "then", "than", "too", "very", "just",
+    "about", "up", "out", "all", "also", "as", "into", "over", "after",
+    "before", "between", "through", "during", "above", "below", "each",
+    "few", "more", "most", "other", "some", "such", "only", "own", "same",
+    "when", "where", "how", "what", "which", "who", "whom", "why",
+    "work", "experience", "team", "company", "role", "ability",
+})
+_WORD_RE = re.compile(r"\b[a-z][a-z+#.]{1,30}\b")
+
+# Tried in priority order. Every match of the first two also contains a
+# match of the last (plain "N years"), so a text it misses has no match at all.
+_YEARS_PATTERNS = (
+    re.compile(r"(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)"),
+    re.compile(r"(?:experience|exp)\s*(?:of\s*)?(\d+)\+?\s*(?:years?|yrs?)"),
+)
+_YEARS_ANY_RE = re.compile(r"(\d+)\+?\s*(?:years?|yrs?)")
+
+
+def extract_skills(text: str, already_lower: bool = False) -> set[str]:
+    """Extract recognized tech skills from text.
+
+    Pass ``already_lower=True`` for lowercased text to skip another copy.
+    """
+    text_lower = text if already_lower else text.lower()
+    found = {skill for skill in _LONG_SKILLS if skill in text_lower}
+    found.update(_SHORT_SKILLS_RE.findall(text_lower))
+    return found
 
 
-def extract_skills(text: str) -> set[str]:
-    """Extract recognized tech skills from text."""
-    text_lower = text.lower()
-    found = set()
+def extract_keywords(text: str, top_n: int = 30, already_lower: bool = False) -> list[str]:
+    """Extract top keywords from text by frequency (excluding stop words)."""
+    # Count every word in C, then drop the few stop words that occurred;
+    # deleting keeps first-seen order, so most_common() ties are unchanged
+    counts = Counter(_WORD_RE.findall(text if already_lower else text.lower()))
+    for word in _STOP_WORDS.intersection(counts):
+        del counts[word]
+    return [word for word, _ in counts.most_common(top_n)]
 
-    for skill in SKILLS:
-        # Use word boundary matching for short skills to avoid false positives
-        if len(skill) <= 2:
-            if re.search(rf"\b{re.escape(skill)}\b", text_lower):
-                found.add(skill)
-        elif skill in text_lower:
-            found.add(skill)
 
-    return found
+def extract_skills_and_keywords(text: str, top_n: int = 30) -> tuple[set[str], list[str]]:
+    """Return (extract_skills(text), extract_keywords(text, top_n)), lowercasing the text once."""
+    text_lower = text.lower()
+    return extract_skills(text_lower, already_lower=True), extract_keywords(text_lower, top_n, already_lower=True)
 
 
-def extract_keywords(text: str, top_n: int = 30) -> list[str]:
-    """Extract top keywords from text by frequency (excluding stop words)."""
-    stop_words = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
-        "being", "have", "has", "had", "do", "does", "did", "will", "would",
-        "could", "should", "may", "might", "can", "shall", "this", "that",
-        "these", "those", "i", "you", "he", "she", "it", "we", "they", "me",
-        "him", "her", "us", "them", "my", "your", "his", "its", "our", "their",
-        "not", "no", "nor", "so", "if", "then", "than", "too", "very", "just",
-        "about", "up", "out", "all", "also", "as", "into", "over", "after",
-        "before", "between", "through", "during", "above", "below", "each",
-        "few", "more", "most", "other", "some", "such", "only", "own", "same",
-        "when", "where", "how", "what", "which", "who", "whom", "why",
-        "work", "experience", "team", "company", "role", "ability",
-    }
-
-    words = re.findall(r"\b[a-z][a-z+#.]{1,30}\b", text.lower())
-    filtered = [w for w in words if w not in stop_words]
-    counts = Counter(filtered)
-    return [word for word, _ in counts.most_common(top_n)]
+# Seniority prefixes, each stripped at most once and in this order (one
+# optional group per prefix), then level suffixes, likewise in order
+_TITLE_PREFIX_RE = re.compile(
+    "".join(
+        f"(?:{re.escape(prefix)})?"
+        for prefix in ("senior ", "sr. ", "sr ", "junior ", "jr. ", "jr ", "lead ", "staff ", "principal ")
+    )
+)
+_TITLE_SUFFIXES = (" i", " ii", " iii", " iv", " v")
 
 
+@lru_cache(maxsize=65536)
 def normalize_title(title: str) -> str:
-    """Normalize a job title for comparison."""
+    """Normalize a job title for comparison.
+
+    Cached: listings repeat a small set of titles ("Software Engineer", ...).
+    """
     title = title.lower().strip()
     # Remove common prefixes/suffixes
-    for prefix in ["senior ", "sr. ", "sr ", "junior ", "jr. ", "jr ", "lead ", "staff ", "principal "]:
-        title = title.removeprefix(prefix)
-    for suffix in [" i", " ii", " iii", " iv", " v"]:
+    title = title[_TITLE_PREFIX_RE.match(title).end():]
+    for suffix in _TITLE_SUFFIXES:
         if title.endswith(suffix):
             title = title[: -len(suffix)]
     return title.strip()
 
 
+@lru_cache(maxsize=65536)
 def title_similarity(title1: str, title2: str) -> float:
     """Compute similarity between two job titles (0.0-1.0)."""
     t1 = normalize_title(title1)
     t2 = normalize_title(title2)
+    return normalized_title_similarity(t1, set(t1.split()), t2, set(t2.split()))
+
 
+def normalized_title_similarity(t1: str, words1: set[str], t2: str, words2: set[str]) -> float:
+    """title_similarity for titles already normalized, with their word sets.
+
+    Lets callers comparing one title against many normalize and split each
+    title once.
+    """
     if t1 == t2:
         return 1.0
 
-    words1 = set(t1.split())
-    words2 = set(t2.split())
-
     if not words1 or not words2:
         return 0.0
 
@@ -125,19 +176,25 @@ def title_similarity(title1: str, title2: str) -> float:
 
 def is_silicon_valley_location(location: str) -> bool:
     """Check if a location string refers to Silicon Valley / Bay Area."""
-    location_lower = location.lower()
-    return any(loc in location_lower for loc in SILICON_VALLEY_LOCATIONS)
+    return _SILICON_VALLEY_RE.search(location.lower()) is not None
+
+
+def mentions_remote(*texts: str) -> bool:
+    """Check if any of the given texts mentions "remote" (case-insensitive).
+
+    Searches each field in place instead of lowercasing a joined copy.
+    """
+    return any(_REMOTE_RE.search(text) for text in texts)
 
 
-def extract_years_experience(text: str) -> int | None:
+def extract_years_experience(text: str, already_lower: bool = False) -> int | None:
     """Try to extract years of experience from text (e.g., '5+ years')."""
-    patterns = [
-        r"(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)",
-        r"(?:experience|exp)\s*(?:of\s*)?(\d+)\+?\s*(?:years?|yrs?)",
-        r"(\d+)\+?\s*(?:years?|yrs?)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
+    text_lower = text if already_lower else text.lower()
+    any_match = _YEARS_ANY_RE.search(text_lower)
+    if not any_match:
+        return None
+    for pattern in _YEARS_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             return int(match.group(1))
-    return None
+    return int(any_match.group(1))
@@ -21,30 +21,34 @@ STATIC_DIR = WEB_DIR / "static"
 
 
 def _create_jinja_env() -> Environment:
+    # Templates ship with the package, so skip the per-lookup mtime check
     return Environment(
         loader=FileSystemLoader(str(TEMPLATES_DIR)),
         autoescape=True,
+        auto_reload=False,
+        cache_size=400,
     )
 
 
 class _Templates:
-    """Thin wrapper that mimics Jinja2Templates from starlette."""
+    """Thin wrapper that mimics Jinja2Templates from starlette.
+
+    Every template is compiled once at startup and looked up by name.
+    """
 
     def __init__(self):
         self.env = _create_jinja_env()
+        self._templates = {name: self.env.get_template(name) for name in self.env.list_templates(extensions=["html"])}
 
     def TemplateResponse(self, name: str, context: dict, status_code: int = 200):
         from starlette.responses import HTMLResponse
-        template = self.env.get_template(name)
+        template = self._templates.get(name) or self.env.get_template(name)
 
-        # Inject current user into every template context
+        # Inject current user into every template context (usually already
+        # looked up by the route, so no extra query)
         request = context.get("request")
         if request and "user" not in context:
-            db = SessionLocal()
-            try:
-                context["user"] = get_current_user(request, db)
-            finally:
-                db.close()
+            context["user"] = get_current_user(request)
 
         html = template.render(**context)
         return HTMLResponse(html, status_code=status_code)
@@ -131,11 +135,7 @@ def create_app() -> FastAPI:
     # Landing page
     @app.get("/")
     def landing(request: Request):
-        db = SessionLocal()
-        try:
-            user = get_current_user(request, db)
-        finally:
-            db.close()
+        user = get_current_user(request)
         if user:
             return RedirectResponse("/dashboard", status_code=303)
         return app.state.templates.TemplateResponse("landing.html", {"request": request})
@@ -6,6 +6,7 @@ import bcrypt
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from job_agent.models import User, UserProfile, UserSettings
 
@@ -14,6 +15,8 @@ from .dependencies import get_db
 router = APIRouter()
 
 
+# bcrypt is deliberately slow (~200ms); the async handlers run it on the
+# threadpool so a login doesn't block the event loop for other requests
 def _hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
 
@@ -58,7 +61,7 @@ async def signup(request: Request, db: Session = Depends(get_db)):
             "auth/signup.html", {"request": request, "error": "An account with this email already exists."}
         )
 
-    user = User(name=name, email=email, password_hash=_hash_password(password))
+    user = User(name=name, email=email, password_hash=await run_in_threadpool(_hash_password, password))
     db.add(user)
     db.flush()
 
@@ -86,7 +89,7 @@ async def login(request: Request, db: Session = Depends(get_db)):
     password = form.get("password", "")
 
     user = db.query(User).filter(User.email == email).first()
-    if not user or not _verify_password(password, user.password_hash):
+    if not user or not await run_in_threadpool(_verify_password, password, user.password_hash):
         return request.app.state.templates.TemplateResponse(
             "auth/login.html", {"request": request, "error": "Invalid email or password."}
         )
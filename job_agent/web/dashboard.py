@@ -2,10 +2,9 @@
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import RedirectResponse
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from job_agent.models import SeenJob, RunHistory
+from job_agent.models import SeenJob, RunHistory, UserStats
 
 from .dependencies import get_db, get_current_user
 
@@ -14,18 +13,36 @@ router = APIRouter(prefix="/dashboard")
 PER_PAGE = 25
 
 
+def _page_rows(db: Session, model, query, page: int) -> list:
+    """Load one page of ``query`` (ordered rows of ``model``).
+
+    The OFFSET runs over an id-only query, which the user's sort index
+    covers (id is the rowid on SQLite and an INCLUDE column on Postgres), so
+    skipped rows are not read from the table; only the page's rows are then
+    loaded, in the same order.
+    """
+    ids = [row_id for (row_id,) in query.with_entities(model.id).offset((page - 1) * PER_PAGE).limit(PER_PAGE)]
+    if not ids:
+        return []
+    rows = {row.id: row for row in db.query(model).filter(model.id.in_(ids))}
+    return [rows[row_id] for row_id in ids]
+
+
+def _user_stats(db: Session, user_id: int) -> UserStats:
+    """The user's dashboard counters; all zero until their first pipeline run."""
+    return db.get(UserStats, user_id) or UserStats(user_id=user_id, total_jobs=0, jobs_emailed=0, total_runs=0)
+
+
 @router.get("")
 def dashboard_index(request: Request, db: Session = Depends(get_db)):
     user = get_current_user(request, db)
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    # Stats
-    total_jobs = db.query(func.count(SeenJob.id)).filter(SeenJob.user_id == user.id).scalar() or 0
-    jobs_emailed = db.query(func.count(SeenJob.id)).filter(
-        SeenJob.user_id == user.id, SeenJob.sent_at.isnot(None)
-    ).scalar() or 0
-    total_runs = db.query(func.count(RunHistory.id)).filter(RunHistory.user_id == user.id).scalar() or 0
+    # Stats: counters kept in user_stats by the pipeline (no row before the
+    # first run), plus the latest run
+    stats = _user_stats(db, user.id)
+    total_jobs, jobs_emailed, total_runs = stats.total_jobs, stats.jobs_emailed, stats.total_runs
     last_run = db.query(RunHistory).filter(
         RunHistory.user_id == user.id
     ).order_by(RunHistory.run_at.desc()).first()
@@ -66,11 +83,11 @@ def jobs_list(request: Request, db: Session = Depends(get_db)):
     else:
         query = query.order_by(SeenJob.match_score.desc())
 
-    total = query.count()
+    total = _user_stats(db, user.id).total_jobs
     total_pages = max(1, (total + PER_PAGE - 1) // PER_PAGE)
     page = min(page, total_pages)
 
-    jobs = query.offset((page - 1) * PER_PAGE).limit(PER_PAGE).all()
+    jobs = _page_rows(db, SeenJob, query, page)
 
     return request.app.state.templates.TemplateResponse("dashboard/jobs.html", {
         "request": request,
@@ -96,11 +113,11 @@ def run_history(request: Request, db: Session = Depends(get_db)):
         RunHistory.user_id == user.id
     ).order_by(RunHistory.run_at.desc())
 
-    total = query.count()
+    total = _user_stats(db, user.id).total_runs
     total_pages = max(1, (total + PER_PAGE - 1) // PER_PAGE)
     page = min(page, total_pages)
 
-    runs = query.offset((page - 1) * PER_PAGE).limit(PER_PAGE).all()
+    runs = _page_rows(db, RunHistory, query, page)
 
     return request.app.state.templates.TemplateResponse("dashboard/history.html", {
         "request": request,
@@ -3,22 +3,44 @@
 from collections.abc import Generator
 
 from fastapi import Request
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from job_agent.models import SessionLocal, User
 
 
 def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_current_user(request: Request, db: Session) -> User | None:
-    """Return the logged-in User or None (reads session cookie)."""
+def get_current_user(request: Request, db: Session | None = None) -> User | None:
+    """Return the logged-in User or None (reads session cookie).
+
+    The user is looked up once per request and kept on ``request.state``;
+    later calls (e.g. the template wrapper) reuse it. Without ``db`` a
+    short-lived session is opened only if the lookup is needed. The user's
+    profile and settings are joined into the same query, so routes read
+    ``user.profile`` / ``user.settings`` without another round-trip.
+    """
     user_id = request.session.get("user_id")
     if user_id is None:
         return None
-    return db.query(User).filter(User.id == user_id, User.is_active.is_(True)).first()
+    cached = getattr(request.state, "current_user", None)
+    if cached is not None and cached[0] == user_id:
+        return cached[1]
+
+    if db is None:
+        db = SessionLocal()
+        try:
+            return get_current_user(request, db)
+        finally:
+            db.close()
+
+    user = (
+        db.query(User)
+        .options(joinedload(User.profile), joinedload(User.settings))
+        .filter(User.id == user_id, User.is_active.is_(True))
+        .first()
+    )
+    request.state.current_user = (user_id, user)
+    return user
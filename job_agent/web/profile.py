@@ -1,5 +1,6 @@
 """Profile management routes — resume upload, LinkedIn, skills."""
 
+import bisect
 import os
 import shutil
 from datetime import datetime, timezone
@@ -8,6 +9,7 @@ from pathlib import Path
 from fastapi import APIRouter, Depends, Request, UploadFile, File
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from job_agent.models import User, UserProfile
 
@@ -17,6 +19,9 @@ router = APIRouter(prefix="/profile")
 
 UPLOAD_DIR = Path(os.environ.get("UPLOAD_DIR", "uploads"))
 
+# Copy buffer for saving uploads (shutil's default is 64 KiB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _require_login(request: Request, db: Session) -> User:
     user = get_current_user(request, db)
@@ -32,13 +37,30 @@ def _redirect_login():
     pass
 
 
+def _save_upload(file: UploadFile, dest: Path) -> None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with open(dest, "wb") as f:
+        shutil.copyfileobj(file.file, f, UPLOAD_CHUNK_SIZE)
+
+
+def _merged_skills(parsed_skills: set[str], current: list[str] | None) -> list[str]:
+    """Skills to store after an import: the parsed ones if any, else the current list.
+
+    Stored skills are always sorted (update_skills inserts into that order),
+    so only a new parsed set is sorted.
+    """
+    if parsed_skills:
+        return sorted(parsed_skills)
+    return current or []
+
+
 @router.get("")
 def profile_page(request: Request, db: Session = Depends(get_db)):
     user = get_current_user(request, db)
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user.id).first()
+    profile = user.profile
     return request.app.state.templates.TemplateResponse("profile/index.html", {
         "request": request,
         "user": user,
@@ -57,24 +79,22 @@ async def upload_resume(request: Request, file: UploadFile = File(...), db: Sess
         return request.app.state.templates.TemplateResponse("profile/index.html", {
             "request": request,
             "user": user,
-            "profile": db.query(UserProfile).filter(UserProfile.user_id == user.id).first(),
+            "profile": user.profile,
             "flash_message": "Please upload a PDF, TXT, or MD file.",
             "flash_type": "error",
         })
 
-    # Save file
-    user_dir = UPLOAD_DIR / str(user.id)
-    user_dir.mkdir(parents=True, exist_ok=True)
-    dest = user_dir / file.filename
-    with open(dest, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    # Save file (directory creation and copy both run in the threadpool)
+    dest = UPLOAD_DIR / str(user.id) / file.filename
+    await run_in_threadpool(_save_upload, file, dest)
 
-    # Parse with existing resume parser
+    # Parse with existing resume parser, off the event loop (PDF text
+    # extraction is CPU-bound and can take seconds)
     from job_agent.profile.resume_parser import parse_resume
     try:
-        parsed = parse_resume(str(dest))
+        parsed = await run_in_threadpool(parse_resume, str(dest))
     except Exception as e:
-        profile = db.query(UserProfile).filter(UserProfile.user_id == user.id).first()
+        profile = user.profile
         return request.app.state.templates.TemplateResponse("profile/index.html", {
             "request": request,
             "user": user,
@@ -84,10 +104,9 @@ async def upload_resume(request: Request, file: UploadFile = File(...), db: Sess
         })
 
     # Update profile in DB
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user.id).first()
+    profile = user.profile
     if not profile:
-        profile = UserProfile(user_id=user.id)
-        db.add(profile)
+        profile = user.profile = UserProfile(user_id=user.id)
 
     profile.resume_filename = file.filename
     profile.resume_path = str(dest)
@@ -95,7 +114,7 @@ async def upload_resume(request: Request, file: UploadFile = File(...), db: Sess
     profile.phone = parsed.phone or profile.phone
     profile.location = parsed.location or profile.location
     profile.summary = parsed.summary or profile.summary
-    profile.skills = sorted(parsed.skills) if parsed.skills else profile.skills or []
+    profile.skills = _merged_skills(parsed.skills, profile.skills)
     profile.job_titles = parsed.job_titles or profile.job_titles or []
     profile.experience_years = parsed.experience_years or profile.experience_years
     profile.education = parsed.education or profile.education or []
@@ -104,8 +123,7 @@ async def upload_resume(request: Request, file: UploadFile = File(...), db: Sess
     profile.parsed_at = datetime.now(timezone.utc)
 
     # Sync parsed data into search settings so pipeline uses the right titles/location
-    from job_agent.models import UserSettings
-    settings = db.query(UserSettings).filter(UserSettings.user_id == user.id).first()
+    settings = user.settings
     if settings:
         if parsed.job_titles:
             settings.job_titles = parsed.job_titles
@@ -134,8 +152,10 @@ async def import_linkedin(request: Request, db: Session = Depends(get_db)):
     form = await request.form()
     linkedin_url = form.get("linkedin_url", "").strip()
 
-    if not linkedin_url or "linkedin.com/in/" not in linkedin_url:
-        profile = db.query(UserProfile).filter(UserProfile.user_id == user.id).first()
+    from job_agent.profile.linkedin_scraper import is_linkedin_profile_url, scrape_linkedin_profile
+
+    if not is_linkedin_profile_url(linkedin_url):
+        profile = user.profile
         return request.app.state.templates.TemplateResponse("profile/index.html", {
             "request": request,
             "user": user,
@@ -144,11 +164,10 @@ async def import_linkedin(request: Request, db: Session = Depends(get_db)):
             "flash_type": "error",
         })
 
-    from job_agent.profile.linkedin_scraper import scrape_linkedin_profile
     try:
-        parsed = scrape_linkedin_profile(linkedin_url)
+        parsed = await run_in_threadpool(scrape_linkedin_profile, linkedin_url)
     except Exception as e:
-        profile = db.query(UserProfile).filter(UserProfile.user_id == user.id).first()
+        profile = user.profile
         return request.app.state.templates.TemplateResponse("profile/index.html", {
             "request": request,
             "user": user,
@@ -157,17 +176,16 @@ async def import_linkedin(request: Request, db: Session = Depends(get_db)):
             "flash_type": "error",
         })
 
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user.id).first()
+    profile = user.profile
     if not profile:
-        profile = UserProfile(user_id=user.id)
-        db.add(profile)
+        profile = user.profile = UserProfile(user_id=user.id)
 
     profile.linkedin_url = linkedin_url
     profile.name = parsed.name or profile.name
     profile.phone = parsed.phone or profile.phone
     profile.location = parsed.location or profile.location
     profile.summary = parsed.summary or profile.summary
-    profile.skills = sorted(parsed.skills) if parsed.skills else profile.skills or []
+    profile.skills = _merged_skills(parsed.skills, profile.skills)
     profile.job_titles = parsed.job_titles or profile.job_titles or []
     profile.experience_years = parsed.experience_years or profile.experience_years
     profile.education = parsed.education or profile.education or []
@@ -176,8 +194,7 @@ async def import_linkedin(request: Request, db: Session = Depends(get_db)):
     profile.parsed_at = datetime.now(timezone.utc)
 
     # Sync parsed data into search settings
-    from job_agent.models import UserSettings
-    settings = db.query(UserSettings).filter(UserSettings.user_id == user.id).first()
+    settings = user.settings
     if settings:
         if parsed.job_titles:
             settings.job_titles = parsed.job_titles
@@ -207,17 +224,20 @@ async def update_skills(request: Request, db: Session = Depends(get_db)):
     action = form.get("action", "")
     skill = form.get("skill", "").strip().lower()
 
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user.id).first()
+    profile = user.profile
     if not profile:
         return RedirectResponse("/profile", status_code=303)
 
+    # Skills are kept sorted, so an add is one insort; a no-op click (adding
+    # a known skill, removing an unknown one) skips the UPDATE entirely
     current_skills = list(profile.skills or [])
 
     if action == "add" and skill and skill not in current_skills:
-        current_skills.append(skill)
-        current_skills.sort()
+        bisect.insort(current_skills, skill)
     elif action == "remove" and skill in current_skills:
         current_skills.remove(skill)
+    else:
+        return RedirectResponse("/profile", status_code=303)
 
     profile.skills = current_skills
     db.commit()
@@ -4,7 +4,6 @@ from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse, RedirectResponse
 from sqlalchemy.orm import Session
 
-from job_agent.models import UserSettings
 from job_agent.scheduler import schedule_user_pipeline, get_next_run_time, get_scheduler_info
 
 from .dependencies import get_db, get_current_user
@@ -18,7 +17,7 @@ def schedule_page(request: Request, db: Session = Depends(get_db)):
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    settings = db.query(UserSettings).filter(UserSettings.user_id == user.id).first()
+    settings = user.settings
     next_run = get_next_run_time(user.id)
 
     return request.app.state.templates.TemplateResponse("schedule/index.html", {
@@ -36,7 +35,7 @@ async def update_schedule(request: Request, db: Session = Depends(get_db)):
         return RedirectResponse("/login", status_code=303)
 
     form = await request.form()
-    settings = db.query(UserSettings).filter(UserSettings.user_id == user.id).first()
+    settings = user.settings
 
     settings.schedule_enabled = form.get("schedule_enabled") == "on"
     settings.schedule_frequency = form.get("schedule_frequency", "weekly")
@@ -48,8 +47,7 @@ async def update_schedule(request: Request, db: Session = Depends(get_db)):
     db.commit()
 
     # Sync with APScheduler
-    schedule_user_pipeline(user.id, settings)
-    next_run = get_next_run_time(user.id)
+    next_run = schedule_user_pipeline(user.id, settings)
 
     return request.app.state.templates.TemplateResponse("schedule/index.html", {
         "request": request,
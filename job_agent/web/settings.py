@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
-from job_agent.models import User, UserSettings
+from job_agent.models import User
 
 from .dependencies import get_db, get_current_user
 
@@ -20,7 +20,7 @@ def settings_page(request: Request, db: Session = Depends(get_db)):
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    settings = db.query(UserSettings).filter(UserSettings.user_id == user.id).first()
+    settings = user.settings
     return request.app.state.templates.TemplateResponse("settings/index.html", {
         "request": request,
         "user": user,
@@ -35,7 +35,7 @@ async def update_search(request: Request, db: Session = Depends(get_db)):
         return RedirectResponse("/login", status_code=303)
 
     form = await request.form()
-    settings = db.query(UserSettings).filter(UserSettings.user_id == user.id).first()
+    settings = user.settings
 
     # Parse job titles (comma-separated)
     raw_titles = form.get("job_titles", "")
@@ -67,7 +67,7 @@ async def update_email(request: Request, db: Session = Depends(get_db)):
         return RedirectResponse("/login", status_code=303)
 
     form = await request.form()
-    settings = db.query(UserSettings).filter(UserSettings.user_id == user.id).first()
+    settings = user.settings
 
     settings.smtp_server = form.get("smtp_server", "").strip() or settings.smtp_server
     settings.smtp_port = int(form.get("smtp_port", 587) or 587)
@@ -98,7 +98,7 @@ async def update_api_keys(request: Request, db: Session = Depends(get_db)):
         return RedirectResponse("/login", status_code=303)
 
     form = await request.form()
-    settings = db.query(UserSettings).filter(UserSettings.user_id == user.id).first()
+    settings = user.settings
 
     new_serpapi = form.get("serpapi_key", "").strip()
     if new_serpapi:
@@ -123,18 +123,17 @@ def run_now(request: Request, db: Session = Depends(get_db)):
     if not user:
         return RedirectResponse("/login", status_code=303)
 
-    from job_agent.pipeline import run_pipeline_for_user
+    from job_agent.scheduler import enqueue_user_pipeline
 
-    # Run synchronously so errors are visible instead of lost in a thread
-    try:
-        run_pipeline_for_user(user.id)
-        flash_message = "Pipeline run complete. Check the Dashboard for results."
+    # Runs on the scheduler's worker pool; errors land in the run history
+    if enqueue_user_pipeline(user.id):
+        flash_message = "Pipeline run started. Check the Dashboard for results in a few minutes."
         flash_type = "success"
-    except Exception as e:
-        flash_message = f"Pipeline error: {e}"
-        flash_type = "error"
+    else:
+        flash_message = "A pipeline run is already in progress."
+        flash_type = "warning"
 
-    settings = db.query(UserSettings).filter(UserSettings.user_id == user.id).first()
+    settings = user.settings
     return request.app.state.templates.TemplateResponse("settings/index.html", {
         "request": request,
         "user": user,
@@ -55,12 +55,26 @@ class TestLoadConfig:
         try:
             config = load_config(path)
             assert config.search.location == "Silicon Valley, CA"
+            assert config.search.parallel_fetch is True
             assert config.matching.score_threshold == 0.3
+            assert config.matching.digest_size == 0
             assert config.email.smtp_server == "smtp.gmail.com"
         finally:
             os.unlink(path)
 
 
+    def test_reload_picks_up_changes(self, config_file):
+        config = load_config(config_file)
+        config.search.job_titles.append("Mutated")
+
+        # Mutating a returned config must not leak into later loads
+        assert load_config(config_file).search.job_titles == ["Software Engineer"]
+
+        with open(config_file, "w") as f:
+            yaml.dump({"search": {"job_titles": ["Data Engineer", "ML Engineer"]}}, f)
+        assert load_config(config_file).search.job_titles == ["Data Engineer", "ML Engineer"]
+
+
 class TestValidateConfig:
     def test_no_profile_source_warns(self):
         config = AppConfig()
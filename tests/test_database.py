@@ -94,3 +94,38 @@ class TestJobDatabase:
         new = db.filter_new_jobs(jobs)
         assert len(new) == 1
         assert new[0].title == "Job D"
+
+    def test_add_jobs_bulk(self, db, sample_job):
+        jobs = [
+            sample_job,
+            sample_job,  # Duplicates are ignored
+            JobListing(title="Job B", company="Co B", url="https://b.com"),
+        ]
+        db.add_jobs(jobs)
+
+        assert db.get_stats()["total_jobs_tracked"] == 2
+        assert db.filter_new_jobs(jobs) == []
+
+    def test_stats_by_source(self, db, sample_job):
+        other = JobListing(title="Job B", company="Co B", url="https://b.com", source="indeed")
+        db.add_jobs([sample_job, other])
+        db.mark_jobs_sent([sample_job.job_id])
+
+        stats = db.get_stats()
+        assert stats["by_source"] == {"serpapi": 1, "indeed": 1}
+        assert stats["total_jobs_tracked"] == 2
+        assert stats["total_jobs_sent"] == 1
+        assert stats["unsent_jobs"] == 1
+
+        plan = db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT source, COUNT(*), COUNT(sent_at) FROM seen_jobs GROUP BY source"
+        ).fetchall()
+        assert any("COVERING INDEX idx_seen_jobs_source_sent" in row["detail"] for row in plan)
+
+    def test_ai_score_cache(self, db, sample_job):
+        assert db.get_ai_scores("profile-a", [sample_job.job_id]) == {}
+
+        db.save_ai_scores("profile-a", {sample_job.job_id: (0.8, "[AI] Strong match")})
+
+        assert db.get_ai_scores("profile-a", [sample_job.job_id]) == {sample_job.job_id: (0.8, "[AI] Strong match")}
+        assert db.get_ai_scores("profile-b", [sample_job.job_id]) == {}
@@ -0,0 +1,106 @@
+"""Tests for the shared SMTP session used by scheduled digests."""
+
+import smtplib
+
+import pytest
+
+from job_agent.config import EmailConfig
+from job_agent.notifications import email_sender
+
+
+class FakeSMTP:
+    """Stand-in for smtplib.SMTP that records connections and sends."""
+
+    instances: list["FakeSMTP"] = []
+
+    def __init__(self, host, port, timeout=None):
+        self.alive = True
+        self.closed = False
+        self.fail_next_send = False
+        self.logins = []
+        self.sent = []
+        FakeSMTP.instances.append(self)
+
+    def ehlo(self):
+        pass
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        self.logins.append((user, password))
+
+    def noop(self):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("gone")
+        return (250, b"OK")
+
+    def send_message(self, msg):
+        if self.fail_next_send:
+            self.fail_next_send = False
+            raise smtplib.SMTPServerDisconnected("dropped")
+        self.sent.append(msg["Subject"])
+
+    def quit(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_smtp(monkeypatch):
+    FakeSMTP.instances = []
+    monkeypatch.setattr(email_sender.smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(email_sender, "_shared_sessions", {})
+    monkeypatch.setattr(email_sender, "_session_locks", {})
+    return FakeSMTP
+
+
+def make_config(password="secret"):
+    return EmailConfig(
+        smtp_server="smtp.example.com",
+        sender_email="agent@example.com",
+        sender_password=password,
+        recipient_email="me@example.com",
+    )
+
+
+class TestSendWithSharedSession:
+    def test_reuses_session_across_calls(self):
+        email_sender.send_with_shared_session(make_config(), "First", "<p>1</p>")
+        email_sender.send_with_shared_session(make_config(), "Second", "<p>2</p>")
+
+        assert len(FakeSMTP.instances) == 1
+        assert FakeSMTP.instances[0].sent == ["First", "Second"]
+
+    def test_reconnects_after_failed_noop(self):
+        email_sender.send_with_shared_session(make_config(), "First", "<p>1</p>")
+        old = FakeSMTP.instances[0]
+        old.alive = False
+
+        email_sender.send_with_shared_session(make_config(), "Second", "<p>2</p>")
+
+        assert old.closed
+        assert len(FakeSMTP.instances) == 2
+        assert FakeSMTP.instances[1].sent == ["Second"]
+
+    def test_disconnect_during_send_closes_old_session(self):
+        email_sender.send_with_shared_session(make_config(), "First", "<p>1</p>")
+        old = FakeSMTP.instances[0]
+        old.fail_next_send = True
+
+        email_sender.send_with_shared_session(make_config(), "Second", "<p>2</p>")
+
+        assert old.closed
+        assert old.sent == ["First"]
+        assert FakeSMTP.instances[1].sent == ["Second"]
+
+    def test_password_change_replaces_session(self):
+        email_sender.send_with_shared_session(make_config("old"), "First", "<p>1</p>")
+        email_sender.send_with_shared_session(make_config("new"), "Second", "<p>2</p>")
+
+        old, new = FakeSMTP.instances
+        assert old.closed
+        assert new.logins == [("agent@example.com", "new")]
+        assert list(email_sender._shared_sessions) == [("smtp.example.com", 587, "agent@example.com")]
@@ -1,7 +1,13 @@
 """Tests for keyword matching."""
 
+import copy
+from concurrent.futures.process import BrokenProcessPool
+
+from job_agent.config import AppConfig
 from job_agent.jobs.models import JobListing
-from job_agent.matching.keyword_matcher import score_job
+from job_agent.matching.keyword_matcher import extract_job_features, score_job, score_jobs
+from job_agent.matching import matcher
+from job_agent.matching.matcher import score_all_profiles, score_and_filter_jobs
 from job_agent.profile.models import ProfileData
 
 
@@ -77,3 +83,94 @@ class TestKeywordMatcher:
         job = make_job()
         score, _ = score_job(profile, job)
         assert 0.0 <= score <= 1.0
+
+    def test_batch_matches_single(self):
+        profile = make_profile()
+        jobs = [
+            make_job(),
+            make_job(title="Product Manager", description="Own the roadmap."),
+            make_job(title="Senior Backend Engineer", description="Python and AWS, 3+ years."),
+        ]
+        assert score_jobs(profile, jobs) == [score_job(profile, job) for job in jobs]
+        assert score_jobs(profile, []) == []
+
+    def test_precomputed_features_match(self):
+        profile = make_profile()
+        job = make_job(description="Python and Kubernetes, 4+ years of experience.")
+        features = extract_job_features(job)
+        assert features.years == 4
+        assert score_job(profile, job, features) == score_job(profile, job)
+
+
+class TestScoreAllProfiles:
+    def test_matches_per_profile_scoring(self):
+        config = AppConfig()
+        profiles = [make_profile(), make_profile(skills={"recruiting"}, job_titles=["Recruiter"])]
+        jobs = [make_job(), make_job(title="Technical Recruiter", description="Recruiting and sourcing.")]
+
+        results = score_all_profiles(profiles, jobs, config)
+
+        assert len(results) == 2
+        for profile, matched in zip(profiles, results):
+            expected = score_and_filter_jobs(profile, [copy.copy(job) for job in jobs], config)
+            assert [(j.title, j.match_score) for j in matched] == [(j.title, j.match_score) for j in expected]
+        # Shared input jobs are not mutated
+        assert all(job.match_score == 0.0 for job in jobs)
+
+
+class TestDigestSize:
+    def test_limit_keeps_top_matches_in_order(self):
+        jobs = [make_job(url=f"https://example.com/{i}", posted_date=f"2026-01-0{i}") for i in range(1, 6)]
+        config = AppConfig()
+        full = score_and_filter_jobs(make_profile(), [copy.copy(job) for job in jobs], config)
+
+        config.matching.digest_size = 2
+        limited = score_and_filter_jobs(make_profile(), jobs, config)
+
+        assert [j.url for j in limited] == [j.url for j in full[:2]]
+
+
+class TestProcessScoring:
+    def test_matches_serial_scoring(self, monkeypatch):
+        monkeypatch.setattr(matcher, "PROCESS_SCORING_MIN_JOBS", 2)
+        monkeypatch.setattr(matcher, "SCORE_PROCESS_WORKERS", 2)
+        monkeypatch.setattr(matcher, "_score_pool", None)
+        profile = make_profile()
+        jobs = [make_job(url=f"https://example.com/{i}", title=title) for i, title in
+                enumerate(["Software Engineer", "Recruiter", "Backend Developer", "Data Engineer", "Designer"])]
+
+        assert matcher._keyword_scores(profile, jobs, None) == score_jobs(profile, jobs)
+        assert matcher._score_pool is not None
+
+    def test_broken_pool_is_replaced(self, monkeypatch):
+        class FakePool:
+            def __init__(self, broken=False, **kwargs):
+                self.broken = broken
+                self.shut_down = False
+
+            def map(self, fn, *iterables):
+                if self.broken:
+                    raise BrokenProcessPool("worker died")
+                return map(fn, *iterables)
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shut_down = True
+
+        broken = FakePool(broken=True)
+        monkeypatch.setattr(matcher, "PROCESS_SCORING_MIN_JOBS", 2)
+        monkeypatch.setattr(matcher, "SCORE_PROCESS_WORKERS", 2)
+        monkeypatch.setattr(matcher, "_score_pool", broken)
+        monkeypatch.setattr(matcher, "ProcessPoolExecutor", FakePool)
+        profile = make_profile()
+        jobs = [make_job(url=f"https://example.com/{i}", title=title) for i, title in
+                enumerate(["Software Engineer", "Recruiter", "Data Engineer"])]
+
+        # Falls back to serial scoring and drops the broken pool
+        assert matcher._keyword_scores(profile, jobs, None) == score_jobs(profile, jobs)
+        assert broken.shut_down
+        assert matcher._score_pool is None
+
+        # The next large batch builds a fresh pool
+        assert matcher._keyword_scores(profile, jobs, None) == score_jobs(profile, jobs)
+        assert isinstance(matcher._score_pool, FakePool)
+        assert matcher._score_pool is not broken
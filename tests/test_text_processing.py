@@ -3,8 +3,10 @@
 from job_agent.utils.text_processing import (
     extract_keywords,
     extract_skills,
+    extract_skills_and_keywords,
     extract_years_experience,
     is_silicon_valley_location,
+    mentions_remote,
     normalize_title,
     title_similarity,
 )
@@ -13,16 +15,11 @@ from job_agent.utils.text_processing import (
 class TestExtractSkills:
     def test_basic_skills(self):
         text = "Experience with Python, Java, and Docker in a cloud environment"
-        skills = extract_skills(text)
-        assert "python" in skills
-        assert "java" in skills
-        assert "docker" in skills
+        assert {"python", "java", "docker"} <= extract_skills(text)
 
     def test_case_insensitive(self):
         text = "Worked with KUBERNETES and React.js"
-        skills = extract_skills(text)
-        assert "kubernetes" in skills
-        assert "react" in skills
+        assert {"kubernetes", "react"} <= extract_skills(text)
 
     def test_no_false_positives_for_short_skills(self):
         text = "Are you ready to go?"
@@ -31,9 +28,7 @@ class TestExtractSkills:
 
     def test_go_language(self):
         text = "Proficient in Go and Rust programming"
-        skills = extract_skills(text)
-        assert "go" in skills
-        assert "rust" in skills
+        assert {"go", "rust"} <= extract_skills(text)
 
     def test_empty_text(self):
         assert extract_skills("") == set()
@@ -42,9 +37,7 @@ class TestExtractSkills:
 class TestExtractKeywords:
     def test_extracts_meaningful_words(self):
         text = "Python developer with machine learning experience using tensorflow"
-        keywords = extract_keywords(text, top_n=10)
-        assert "python" in keywords
-        assert "tensorflow" in keywords
+        assert {"python", "tensorflow"} <= set(extract_keywords(text, top_n=10))
 
     def test_excludes_stop_words(self):
         text = "The quick brown fox jumps over the lazy dog"
@@ -55,6 +48,12 @@ class TestExtractKeywords:
         assert extract_keywords("") == []
 
 
+class TestExtractSkillsAndKeywords:
+    def test_matches_separate_extractors(self):
+        text = "Senior Python Engineer building Kubernetes platforms in Go. Python and AWS daily."
+        assert extract_skills_and_keywords(text) == (extract_skills(text), extract_keywords(text))
+
+
 class TestTitleSimilarity:
     def test_exact_match(self):
         assert title_similarity("Software Engineer", "Software Engineer") == 1.0
@@ -113,3 +112,11 @@ class TestIsSiliconValleyLocation:
 
     def test_case_insensitive(self):
         assert is_silicon_valley_location("SILICON VALLEY")
+
+
+class TestMentionsRemote:
+    def test_any_field(self):
+        assert mentions_remote("Software Engineer", "REMOTE - US", "")
+
+    def test_no_mention(self):
+        assert not mentions_remote("Software Engineer", "San Jose, CA", "On-site role")